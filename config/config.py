@@ -2,18 +2,88 @@
 Configuration management for GitHub Actions Report Generator.
 """
 
+import functools
 import json
 import logging
+import mmap
 import os
-from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+_VALID_FORMATS = frozenset({'text', 'json', 'both'})
+
+# Parsed config files keyed by (absolute path, mtime_ns) so repeated Config()
+# construction in the same process skips re-reading and re-decoding the JSON.
+_CONFIG_CACHE: dict = {}
+
+# Config files larger than this are streamed with ijson (when installed) so
+# unknown top-level sections are decoded and dropped one at a time.
+_STREAM_THRESHOLD = 1024 * 1024
+
+# Below this size copying the file is cheaper than setting up an mmap
+_MMAP_THRESHOLD = 4096
+
+# Environment variable -> Config attribute overrides
+# (GITHUB_TOKEN is read lazily by Config.github_token)
+_ENV_MAPPINGS = (
+    ('REPO_OWNER', 'repo_owner'),
+    ('REPO_NAME', 'repo_name'),
+    ('OUTPUT_FORMAT', 'output_format'),
+)
+_ENV_KEYS = frozenset(env_var for env_var, _ in _ENV_MAPPINGS)
+
 
 class Config:
     """Configuration manager for the report generator."""
     
+    # Default configuration; instances only shadow values that are overridden
+    repo_owner = "etn-ccis"
+    repo_name = "edge-rtos-github-builds"
+    _file_github_token = None
+    
+    # Artifact processing settings
+    skip_build_artifacts = True
+    supported_test_formats = frozenset({'.xml', '.json', '.html', '.txt', '.log'})
+    parallel_extract = True
+    collect_all_tests = True  # False keeps only failed/errored JUnit test cases
+    
+    # Output settings
+    output_format = "both"  # 'text', 'json', 'both'
+    include_passed_tests = False
+    max_failure_message_length = 500
+    
+    # GitHub API settings
+    http_cache_file = None  # on-disk response cache path, e.g. "github_cache.sqlite" (needs requests-cache)
+    
+    _CONFIG_KEYS = frozenset({
+        'repo_owner', 'repo_name', 'github_token',
+        'skip_build_artifacts', 'supported_test_formats', 'parallel_extract',
+        'collect_all_tests', 'output_format', 'include_passed_tests', 'max_failure_message_length',
+        'http_cache_file',
+    })
+    
+    # Keys written by save_config, in output order (tokens are never saved)
+    _SAVE_KEYS = (
+        'repo_owner', 'repo_name', 'skip_build_artifacts', 'supported_test_formats',
+        'parallel_extract', 'collect_all_tests', 'output_format', 'include_passed_tests',
+        'max_failure_message_length', 'http_cache_file',
+    )
+    
     def __init__(self, config_file: str = "config.json"):
         """Initialize configuration from file or environment variables."""
         self.config_file = config_file
@@ -21,97 +91,134 @@ class Config:
     
     def _load_config(self):
         """Load configuration from file and environment variables."""
-        # Default configuration
-        self.repo_owner = "etn-ccis"
-        self.repo_name = "edge-rtos-github-builds"
-        self.github_token = None
-        
-        # Artifact processing settings
-        self.skip_build_artifacts = True
-        self.supported_test_formats = ['.xml', '.json', '.html', '.txt', '.log']
-        
-        # Output settings
-        self.output_format = "both"  # 'text', 'json', 'both'
-        self.include_passed_tests = False
-        self.max_failure_message_length = 500
-        
         # Load from config file if it exists
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    file_config = json.load(f)
-                    
-                self._update_from_dict(file_config)
-                logger.info(f"Loaded configuration from {self.config_file}")
-                
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Failed to load config file {self.config_file}: {e}")
+        try:
+            file_config = self._read_config_file()
+            self._update_from_dict(file_config)
+            logger.info("Loaded configuration from %s", self.config_file)
+            
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning("Failed to load config file %s: %s", self.config_file, e)
         
         # Override with environment variables
         self._load_from_environment()
         
-        # Validate required settings
-        if not self.repo_owner or not self.repo_name:
-            raise ValueError("Repository owner and name must be configured")
+        # Validate required settings; the token may still be supplied later
+        self.validate(warn_missing_token=False)
+    
+    def _read_config_file(self) -> dict:
+        """Read and parse the config file, reusing a cached parse if unchanged."""
+        st = os.stat(self.config_file)
+        key = (os.path.abspath(self.config_file), st.st_mtime_ns)
+        file_config = _CONFIG_CACHE.get(key)
+        if file_config is None:
+            file_config = self._parse_config_file(st)
+            _CONFIG_CACHE[key] = file_config
+        return file_config
+    
+    def _parse_config_file(self, st: os.stat_result) -> dict:
+        """Parse the config file with the fastest available JSON reader."""
+        if IJSON_AVAILABLE and st.st_size > _STREAM_THRESHOLD:
+            return self._stream_config_file()
+        if ORJSON_AVAILABLE:
+            with open(self.config_file, 'rb') as f:
+                if st.st_size <= _MMAP_THRESHOLD:
+                    return orjson.loads(f.read())
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+        with open(self.config_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _stream_config_file(self) -> dict:
+        """Stream top-level config entries, keeping values only for known keys."""
+        try:
+            with open(self.config_file, 'rb') as f:
+                # Unknown keys are kept (without their value) for the warning
+                return {
+                    key: value if key in self._CONFIG_KEYS else None
+                    for key, value in ijson.kvitems(f, '', use_float=True)
+                }
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(str(e), '', 0) from e
     
     def _update_from_dict(self, config_dict: dict):
         """Update configuration from dictionary."""
-        for key, value in config_dict.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
-            else:
-                logger.warning(f"Unknown configuration key: {key}")
+        known = self._CONFIG_KEYS
+        allowed = {key: value for key, value in config_dict.items() if key in known}
+        if 'supported_test_formats' in allowed:
+            allowed['supported_test_formats'] = frozenset(allowed['supported_test_formats'])
+        if 'github_token' in allowed:
+            allowed['_file_github_token'] = allowed.pop('github_token')
+        vars(self).update(allowed)
+        
+        for key in config_dict:
+            if key not in known:
+                logger.warning("Unknown configuration key: %s", key)
+    
+    @functools.cached_property
+    def github_token(self) -> Optional[str]:
+        """GitHub token, read from GITHUB_TOKEN (over the config file) on first use."""
+        return os.environ.get('GITHUB_TOKEN') or self._file_github_token
     
     def _load_from_environment(self):
         """Load configuration from environment variables."""
-        env_mappings = {
-            'GITHUB_TOKEN': 'github_token',
-            'REPO_OWNER': 'repo_owner',
-            'REPO_NAME': 'repo_name',
-            'OUTPUT_FORMAT': 'output_format',
-        }
+        environ = os.environ
+        present = _ENV_KEYS & environ.keys()
+        if not present:
+            return
         
-        for env_var, attr_name in env_mappings.items():
-            env_value = os.getenv(env_var)
+        # Iterate the mapping (not the set) so overrides apply in a stable order
+        for env_var, attr_name in _ENV_MAPPINGS:
+            if env_var not in present:
+                continue
+            env_value = environ[env_var]
             if env_value:
                 setattr(self, attr_name, env_value)
-                logger.debug(f"Set {attr_name} from environment variable {env_var}")
+                logger.debug("Set %s from environment variable %s", attr_name, env_var)
     
     def save_config(self, config_file: Optional[str] = None):
         """Save current configuration to file."""
         if config_file is None:
             config_file = self.config_file
         
-        config_dict = {
-            'repo_owner': self.repo_owner,
-            'repo_name': self.repo_name,
-            'skip_build_artifacts': self.skip_build_artifacts,
-            'supported_test_formats': self.supported_test_formats,
-            'output_format': self.output_format,
-            'include_passed_tests': self.include_passed_tests,
-            'max_failure_message_length': self.max_failure_message_length,
-        }
+        config_dict = {key: getattr(self, key) for key in self._SAVE_KEYS}
+        config_dict['supported_test_formats'] = sorted(self.supported_test_formats)
         
-        # Don't save sensitive information like tokens
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(config_dict, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(config_dict, indent=2).encode('utf-8')
         
+        # Write to a sibling temp file and rename so readers never see a partial file
+        tmp_file = config_file + '.tmp'
         try:
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_dict, f, indent=2)
-            logger.info(f"Configuration saved to {config_file}")
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                if os.name != 'nt':
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, config_file)
+            logger.info("Configuration saved to %s", config_file)
         except IOError as e:
-            logger.error(f"Failed to save configuration: {e}")
+            logger.error("Failed to save configuration: %s", e)
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
     
-    def validate(self):
+    def validate(self, warn_missing_token: bool = True):
         """Validate configuration settings."""
-        if not self.github_token:
+        if warn_missing_token and not self.github_token:
             logger.warning("GitHub token not configured. API rate limits will be lower.")
         
         if not self.repo_owner or not self.repo_name:
             raise ValueError("Repository owner and name are required")
         
-        valid_formats = ['text', 'json', 'both']
-        if self.output_format not in valid_formats:
-            raise ValueError(f"Invalid output format: {self.output_format}. Must be one of {valid_formats}")
+        if self.output_format not in _VALID_FORMATS:
+            raise ValueError(f"Invalid output format: {self.output_format}. Must be one of {sorted(_VALID_FORMATS)}")
     
     def __str__(self):
         """String representation of configuration."""
@@ -8,15 +8,146 @@ This module provides functionality to interact with GitHub's REST API to:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
+import sys
+import random
+import re
+import tempfile
+import threading
 import time
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Dict, Iterator, List, Any, Optional, Tuple
 from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
 import zipfile
 import io
 
+try:
+    from requests_cache import CachedSession
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+    CachedSession = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# slots=True needs Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Upper bound on concurrent page requests when listing artifacts
+_MAX_PAGE_WORKERS = 8
+
+# Build artifacts are skipped unless their name suggests they carry test results
+_BUILD_ARTIFACT_RE = re.compile(r'build')
+_TEST_ARTIFACT_RE = re.compile(r'test|report|result')
+
+# Persistent response cache (requests-cache, opt-in via config.http_cache_file):
+# entries are fresh for this long and revalidated with the stored
+# ETag/Last-Modified afterwards
+_HTTP_CACHE_EXPIRE_AFTER = 300
+
+# Connection pool sized for concurrent page fetches and downloads; transient
+# gateway errors on GETs are retried with exponential backoff by urllib3
+_POOL_CONNECTIONS = 4
+_POOL_MAXSIZE = 32
+_RETRY_TOTAL = 5
+_RETRY_BACKOFF_FACTOR = 0.5
+_RETRY_STATUSES = (502, 503, 504)
+
+# Rate-limited requests (429, or 403 caused by a rate limit) are retried in
+# _make_request with capped exponential backoff and jitter
+_RATE_LIMIT_ATTEMPTS = 5
+_RATE_LIMIT_BASE_DELAY = 1.0
+_RATE_LIMIT_MAX_DELAY = 60.0
+
+# Artifact downloads are streamed in chunks and kept in memory up to the
+# spool size, beyond which they spill to a temporary file on disk
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+_DOWNLOAD_SPOOL_SIZE = 8 * 1024 * 1024
+_MAX_DOWNLOAD_WORKERS = 6
+
+# Conditional GET cache: bodies of the most recently used JSON API responses
+_ETAG_CACHE_SIZE = 256
+
+# Run info cache: completed runs never change, others are reused briefly
+_RUN_INFO_CACHE_SIZE = 128
+_RUN_INFO_TTL = 15.0  # seconds, for runs that are not completed yet
+
+# Adaptive (AIMD) request pacing: the minimum gap between requests shrinks
+# gradually while GitHub answers normally and doubles on throttling or
+# server errors, so bursts back off before hitting secondary rate limits.
+# A 403 only counts as throttling when its rate limit headers say so.
+_THROTTLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_THROTTLE_INITIAL_BACKOFF = 0.5  # seconds, first gap after an unthrottled run
+_THROTTLE_MAX_INTERVAL = 60.0
+_THROTTLE_DECAY = 0.95
+_THROTTLE_MIN_INTERVAL = 0.01  # gaps below this are dropped to zero
+
+
+def _is_cacheable_response(response: requests.Response) -> bool:
+    """
+    Persist only JSON API responses; artifact archives stay out of the cache.
+    
+    A run (or run list) that includes any run not yet completed is never
+    persisted, so its status is always fetched fresh on the next call.
+    """
+    if 'json' not in response.headers.get('Content-Type', ''):
+        return False
+    
+    try:
+        data = _response_json(response)
+    except ValueError:
+        return False
+    if not isinstance(data, dict):
+        return True
+    
+    if 'workflow_runs' in data:
+        runs = data['workflow_runs']
+    elif 'status' in data:
+        runs = (data,)
+    else:
+        return True
+    return all(run.get('status') == 'completed' for run in runs)
+
+
+def _response_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class ArtifactMeta:
+    """The fields of a GitHub Actions artifact that the report pipeline uses."""
+    id: int
+    name: str
+    size_in_bytes: int = 0
+    archive_download_url: str = ''
+    created_at: Optional[str] = None
+    
+    @classmethod
+    def from_api(cls, artifact: Dict[str, Any]) -> 'ArtifactMeta':
+        """Build from an artifact object of the REST API, dropping all other keys."""
+        return cls(artifact['id'], artifact['name'], artifact.get('size_in_bytes', 0),
+                   artifact.get('archive_download_url', ''), artifact.get('created_at'))
+
+
+def _artifact_age_key(artifact: ArtifactMeta) -> Tuple[str, int]:
+    """Sort key ordering artifacts by creation time, then by (monotonic) ID."""
+    return artifact.created_at or '', artifact.id
+
 
 class GitHubAPIClient:
     """Client for interacting with GitHub API to fetch run data and artifacts."""
@@ -25,7 +156,24 @@ class GitHubAPIClient:
         """Initialize GitHub API client with configuration."""
         self.config = config
         self.base_url = "https://api.github.com"
-        self.session = requests.Session()
+        # Every endpoint used here is under the configured repository
+        self._repo_base = f"{self.base_url}/repos/{config.repo_owner}/{config.repo_name}"
+        # Persist JSON responses across runs when configured and requests-cache is installed
+        cache_file = getattr(config, 'http_cache_file', None)
+        if REQUESTS_CACHE_AVAILABLE and cache_file:
+            self.session = CachedSession(cache_file, backend='sqlite', cache_control=True,
+                                         expire_after=_HTTP_CACHE_EXPIRE_AFTER, allowable_methods=('GET',),
+                                         filter_fn=_is_cacheable_response)
+        else:
+            self.session = requests.Session()
+        
+        # Keep TCP+TLS connections warm across threads; the default pool holds only 10
+        retry = Retry(total=_RETRY_TOTAL, backoff_factor=_RETRY_BACKOFF_FACTOR,
+                      status_forcelist=_RETRY_STATUSES, allowed_methods=['GET'],
+                      raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE,
+                              max_retries=retry)
+        self.session.mount('https://', adapter)
         
         # Set up authentication if provided
         if hasattr(config, 'github_token') and config.github_token:
@@ -41,26 +189,117 @@ class GitHubAPIClient:
         # Rate limiting
         self.rate_limit_remaining = 5000
         self.rate_limit_reset = 0
+        self._rate_limit_lock = threading.Lock()
+        self._min_interval = 0.0
+        self._last_req_ts = 0.0
+        self._retry_after_until = 0.0
+        
+        # Conditional GET cache: request URL -> (ETag, decoded JSON body, Link
+        # header), least recently used first. GitHub does not count 304 Not
+        # Modified replies against the rate limit.
+        self._etag_cache: 'OrderedDict[str, Tuple[str, Any, Dict[str, Dict[str, str]]]]' = OrderedDict()
+        self._etag_lock = threading.Lock()
+        
+        # run_id -> (fetch time, run data), least recently used first
+        self._run_info_cache: 'OrderedDict[str, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        
+        # Repository workflows, listed once for server-side run filtering
+        self._workflows: Optional[List[Dict[str, Any]]] = None
     
     def _check_rate_limit(self):
-        """Check and handle GitHub API rate limiting."""
-        if self.rate_limit_remaining < 10:
+        """Check and handle GitHub API rate limiting, pacing requests adaptively."""
+        with self._rate_limit_lock:
+            remaining = self.rate_limit_remaining
+            reset = self.rate_limit_reset
+        
+        # Hard bound: the primary rate limit is nearly exhausted until reset
+        if remaining < 10:
             current_time = int(time.time())
-            if current_time < self.rate_limit_reset:
-                sleep_time = self.rate_limit_reset - current_time + 1
+            if current_time < reset:
+                sleep_time = reset - current_time + 1
                 logger.warning(f"Rate limit low. Sleeping for {sleep_time} seconds...")
                 time.sleep(sleep_time)
+        
+        # Reserve the next send slot so concurrent callers stay spaced apart
+        with self._rate_limit_lock:
+            now = time.monotonic()
+            send_at = max(now, self._last_req_ts + self._min_interval, self._retry_after_until)
+            self._last_req_ts = send_at
+        
+        if send_at > now:
+            time.sleep(send_at - now)
     
-    def _make_request(self, url: str, **kwargs) -> requests.Response:
-        """Make a request to GitHub API with rate limiting and error handling."""
-        self._check_rate_limit()
+    def _update_throttle(self, response: requests.Response):
+        """Adjust request pacing from a response: gradual decay on success, doubling on throttling."""
+        throttled = response.status_code in _THROTTLE_STATUSES or (
+            response.status_code == 403 and
+            (response.headers.get('X-RateLimit-Remaining') == '0' or 'Retry-After' in response.headers))
         
+        with self._rate_limit_lock:
+            if throttled:
+                self._min_interval = min(_THROTTLE_MAX_INTERVAL,
+                                         max(_THROTTLE_INITIAL_BACKOFF, self._min_interval * 2.0))
+                
+                retry_after = response.headers.get('Retry-After')
+                if retry_after:
+                    try:
+                        self._retry_after_until = time.monotonic() + float(retry_after)
+                    except ValueError:
+                        pass  # HTTP-date form; the doubled interval still applies
+                
+                logger.warning(f"GitHub API returned {response.status_code}; "
+                               f"spacing requests {self._min_interval:.2f}s apart")
+            elif self._min_interval:
+                self._min_interval *= _THROTTLE_DECAY
+                if self._min_interval < _THROTTLE_MIN_INTERVAL:
+                    self._min_interval = 0.0
+    
+    @staticmethod
+    def _is_rate_limited(response: requests.Response) -> bool:
+        """Return True if a response was rejected by a primary or secondary rate limit."""
+        if response.status_code == 429:
+            return True
+        if response.status_code != 403:
+            return False
+        return (response.headers.get('X-RateLimit-Remaining') == '0' or
+                'Retry-After' in response.headers or
+                'rate limit' in response.text.lower())
+    
+    @staticmethod
+    def _rate_limit_delay(response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a rate-limited request."""
         try:
-            response = self.session.get(url, **kwargs)
-            
-            # Update rate limit info
-            self.rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', 5000))
-            self.rate_limit_reset = int(response.headers.get('X-RateLimit-Reset', 0))
+            float(response.headers.get('Retry-After', ''))
+            return 0.0  # _update_throttle already deferred the next request slot
+        except ValueError:
+            delay = min(_RATE_LIMIT_MAX_DELAY, _RATE_LIMIT_BASE_DELAY * 2 ** attempt)
+            return delay * random.uniform(0.5, 1.5)
+    
+    def _make_request(self, url: str, **kwargs) -> requests.Response:
+        """Make a request to GitHub API with rate limiting, retries and error handling."""
+        try:
+            for attempt in range(_RATE_LIMIT_ATTEMPTS):
+                # Waits out an exhausted rate limit window and any Retry-After deferral
+                self._check_rate_limit()
+                
+                response = self.session.get(url, **kwargs)
+                
+                # Update rate limit info (headers replayed from the on-disk cache are stale)
+                if not getattr(response, 'from_cache', False):
+                    with self._rate_limit_lock:
+                        self.rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', 5000))
+                        self.rate_limit_reset = int(response.headers.get('X-RateLimit-Reset', 0))
+                
+                self._update_throttle(response)
+                
+                if attempt + 1 == _RATE_LIMIT_ATTEMPTS or not self._is_rate_limited(response):
+                    break
+                
+                delay = self._rate_limit_delay(response, attempt)
+                logger.warning(f"Rate limited ({response.status_code}) on attempt {attempt + 1}; "
+                               f"retrying in {delay:.1f}s")
+                response.close()
+                time.sleep(delay)
             
             response.raise_for_status()
             return response
@@ -69,22 +308,87 @@ class GitHubAPIClient:
             logger.error(f"GitHub API request failed: {e}")
             raise
     
+    def _get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, Dict[str, Dict[str, str]]]:
+        """
+        Fetch a JSON API resource, revalidating it with its ETag when seen before.
+        
+        Returns:
+            The decoded body and the parsed Link header. On 304 Not Modified
+            both come from the cache, which keeps only the ETag, body and links.
+        """
+        prepared = requests.models.PreparedRequest()
+        prepared.prepare_url(url, params)
+        cache_key = prepared.url
+        
+        with self._etag_lock:
+            cached = self._etag_cache.get(cache_key)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        
+        response = self._make_request(url, params=params, headers=headers)
+        
+        if response.status_code == 304 and cached:
+            logger.debug(f"Not modified, using cached response: {cache_key}")
+            with self._etag_lock:
+                if cache_key in self._etag_cache:
+                    self._etag_cache.move_to_end(cache_key)
+            return cached[1], cached[2]
+        
+        data = _response_json(response)
+        links = response.links
+        
+        etag = response.headers.get('ETag')
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[cache_key] = (etag, data, links)
+                self._etag_cache.move_to_end(cache_key)
+                if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        
+        return data, links
+    
+    @staticmethod
+    def _last_page(links: Dict[str, Dict[str, str]]) -> Optional[int]:
+        """Return the page number of the Link header's rel="last" URL, if any."""
+        last_url = links.get('last', {}).get('url')
+        if not last_url:
+            return None
+        
+        try:
+            return int(parse_qs(urlsplit(last_url).query)['page'][0])
+        except (KeyError, IndexError, ValueError):
+            return None
+    
     def get_run_info(self, run_id: str) -> Dict[str, Any]:
         """
         Get information about a specific GitHub Actions run.
         
+        Completed runs are cached for the client's lifetime; runs still in
+        progress are reused for a few seconds before being fetched again.
+        
         Args:
             run_id: The GitHub Actions run ID
             
         Returns:
             Dictionary containing run information
         """
-        url = f"{self.base_url}/repos/{self.config.repo_owner}/{self.config.repo_name}/actions/runs/{run_id}"
+        cache_key = str(run_id)
+        cached = self._run_info_cache.get(cache_key)
+        if cached:
+            fetched_at, run_data = cached
+            if run_data.get('status') == 'completed' or time.monotonic() - fetched_at < _RUN_INFO_TTL:
+                self._run_info_cache.move_to_end(cache_key)
+                logger.debug(f"Using cached run info for run {run_id}")
+                return run_data
+        
+        url = f"{self._repo_base}/actions/runs/{run_id}"
         
         logger.info(f"Fetching run info from: {url}")
-        response = self._make_request(url)
+        run_data, _ = self._get_json(url)
         
-        run_data = response.json()
+        self._run_info_cache[cache_key] = (time.monotonic(), run_data)
+        self._run_info_cache.move_to_end(cache_key)
+        if len(self._run_info_cache) > _RUN_INFO_CACHE_SIZE:
+            self._run_info_cache.popitem(last=False)
         
         logger.info(f"Run: {run_data.get('name', 'Unknown')} - Status: {run_data.get('status', 'Unknown')}")
         logger.info(f"Created: {run_data.get('created_at', 'Unknown')}")
@@ -92,89 +396,244 @@ class GitHubAPIClient:
         
         return run_data
     
-    def get_run_artifacts(self, run_id: str) -> List[Dict[str, Any]]:
+    def get_run_artifacts(self, run_id: str) -> List[ArtifactMeta]:
         """
         Get list of artifacts for a specific GitHub Actions run.
         Handles pagination to fetch all artifacts (not just first 30).
         
+        When several artifacts share a name (e.g. uploaded by re-run attempts),
+        only the newest one is kept, at the position of the first occurrence.
+        
         Args:
             run_id: The GitHub Actions run ID
             
         Returns:
-            List of artifact dictionaries
+            List of artifacts
+        """
+        by_name: Dict[str, ArtifactMeta] = {}
+        for artifact in self.iter_run_artifacts(run_id):
+            current = by_name.get(artifact.name)
+            if current is None or _artifact_age_key(artifact) > _artifact_age_key(current):
+                by_name[artifact.name] = artifact
+        
+        return list(by_name.values())
+    
+    def iter_run_artifacts(self, run_id: str) -> Iterator[ArtifactMeta]:
         """
-        base_url = f"{self.base_url}/repos/{self.config.repo_owner}/{self.config.repo_name}/actions/runs/{run_id}/artifacts"
+        Yield the test-related artifacts of a GitHub Actions run page by page.
+        
+        Paging follows the Link header: without rel="next" the first page is
+        the only one, otherwise the remaining pages up to rel="last" are
+        requested concurrently in the background, so later pages download
+        while the caller consumes earlier ones. If rel="last" is missing, the
+        rel="next" links are followed one page at a time. Artifacts are
+        yielded in page order.
+        
+        Listing stays on REST: GitHub's GraphQL WorkflowRun type exposes no
+        artifacts connection, so there is no single-query alternative.
         
-        all_artifacts = []
-        page = 1
+        Args:
+            run_id: The GitHub Actions run ID
+            
+        Yields:
+            Artifacts, with build artifacts filtered out
+        """
         per_page = 100  # GitHub API max per page
+        page_url = f"{self._repo_base}/actions/runs/{run_id}/artifacts?per_page={per_page}&page="
+        
+        def fetch_page(page: int) -> List[Dict[str, Any]]:
+            url = page_url + str(page)
+            logger.debug(f"Requesting page {page}: {url}")
+            return self._get_json(url)[0].get('artifacts', [])
+        
+        def follow_next(links: Dict[str, Dict[str, str]]) -> Iterator[List[Dict[str, Any]]]:
+            while 'next' in links:
+                data, links = self._get_json(links['next']['url'])
+                yield data.get('artifacts', [])
         
         logger.info(f"Fetching artifacts from run {run_id} with pagination...")
         
-        while True:
-            url = f"{base_url}?page={page}&per_page={per_page}"
-            logger.debug(f"Requesting page {page}: {url}")
-            
-            response = self._make_request(url)
-            artifacts_data = response.json()
-            
-            artifacts = artifacts_data.get('artifacts', [])
-            total_count = artifacts_data.get('total_count', 0)
-            
-            if not artifacts:
-                # No more artifacts
-                break
-            
-            all_artifacts.extend(artifacts)
-            logger.info(f"Page {page}: Found {len(artifacts)} artifacts (Total so far: {len(all_artifacts)}/{total_count})")
-            
-            # Check if we have all artifacts
-            if len(all_artifacts) >= total_count or len(artifacts) < per_page:
-                break
-            
-            page += 1
+        # The first page tells us how many pages there are
+        url = page_url + '1'
+        logger.debug(f"Requesting page 1: {url}")
+        artifacts_data, links = self._get_json(url)
         
-        logger.info(f"Found {len(all_artifacts)} total artifacts across {page} pages")
+        artifacts = artifacts_data.get('artifacts', [])
+        total_count = artifacts_data.get('total_count', 0)
+        found = len(artifacts)
+        kept = 0
+        num_pages = 1
+        logger.info(f"Page 1: Found {len(artifacts)} artifacts (Total so far: {found}/{total_count})")
         
-        # Filter out build artifacts if configured
-        filtered_artifacts = []
-        for artifact in all_artifacts:
+        for artifact in self._filter_artifacts(artifacts):
+            kept += 1
+            yield artifact
+        
+        # GitHub updates total_count asynchronously, so the Link header decides
+        # whether more pages exist
+        if 'next' in links:
+            last_page = self._last_page(links)
+            max_workers = min(_MAX_PAGE_WORKERS, max(1, (last_page or 2) - 1))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                if last_page is None:
+                    # Without a usable rel="last" the page count is unknown; walk rel="next"
+                    pages = follow_next(links)
+                else:
+                    pages = executor.map(fetch_page, range(2, last_page + 1))
+                
+                for page, artifacts in enumerate(pages, 2):
+                    num_pages = page
+                    found += len(artifacts)
+                    logger.info(f"Page {page}: Found {len(artifacts)} artifacts (Total so far: {found}/{total_count})")
+                    for artifact in self._filter_artifacts(artifacts):
+                        kept += 1
+                        yield artifact
+        
+        logger.info(f"Found {found} total artifacts across {num_pages} pages")
+        logger.info(f"After filtering: {kept} test-related artifacts")
+    
+    @staticmethod
+    def _filter_artifacts(artifacts: List[Dict[str, Any]]) -> Iterator[ArtifactMeta]:
+        """Yield the API artifact objects that are not plain build artifacts, as ArtifactMeta."""
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for artifact in artifacts:
             name = artifact['name'].lower()
             
             # Skip build artifacts unless they contain test results
-            if 'build' in name and not any(test_keyword in name for test_keyword in ['test', 'report', 'result']):
-                logger.debug(f"Filtering out build artifact: {artifact['name']}")
+            if _BUILD_ARTIFACT_RE.search(name) and not _TEST_ARTIFACT_RE.search(name):
+                if debug:
+                    logger.debug(f"Filtering out build artifact: {artifact['name']}")
                 continue
-                
-            filtered_artifacts.append(artifact)
-            logger.debug(f"  - {artifact['name']} ({artifact['size_in_bytes']} bytes)")
-        
-        logger.info(f"After filtering: {len(filtered_artifacts)} test-related artifacts")
-        return filtered_artifacts
+            
+            if debug:
+                logger.debug(f"  - {artifact['name']} ({artifact['size_in_bytes']} bytes)")
+            yield ArtifactMeta.from_api(artifact)
     
-    def download_artifact(self, artifact_id: int) -> bytes:
+    def download_artifact(self, artifact_id: int) -> BinaryIO:
         """
         Download artifact contents by artifact ID.
         
+        The ZIP is streamed into a spooled temporary file, so large artifacts
+        spill to disk instead of being held in memory as one bytes object.
+        
         Args:
             artifact_id: The artifact ID to download
             
         Returns:
-            Raw artifact data as bytes
+            Binary file positioned at the start of the raw artifact ZIP data.
+            The caller owns it and must close it (use it as a context manager).
         """
-        url = f"{self.base_url}/repos/{self.config.repo_owner}/{self.config.repo_name}/actions/artifacts/{artifact_id}/zip"
+        url = f"{self._repo_base}/actions/artifacts/{artifact_id}/zip"
         
         logger.info(f"Downloading artifact {artifact_id}...")
-        response = self._make_request(url)
+        spool = tempfile.SpooledTemporaryFile(max_size=_DOWNLOAD_SPOOL_SIZE)
+        try:
+            with self._make_request(url, stream=True) as response:
+                for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    spool.write(chunk)
+        except BaseException:
+            spool.close()
+            raise
+        
+        logger.info(f"Downloaded {spool.tell()} bytes")
+        spool.seek(0)
+        return spool
+    
+    def download_artifacts_bulk(self, artifact_ids: List[int],
+                                max_workers: int = _MAX_DOWNLOAD_WORKERS) -> Iterator[Tuple[int, BinaryIO]]:
+        """
+        Download several artifacts concurrently.
+        
+        Downloads share the session's connection pool and the adaptive request
+        throttle, so concurrency backs off when GitHub starts throttling.
+        Results are yielded in the order of artifact_ids, so the caller can
+        extract one artifact while the later ones are still transferring and
+        still see artifacts in a deterministic order.
+        
+        Args:
+            artifact_ids: IDs of the artifacts to download
+            max_workers: Maximum number of concurrent downloads
+            
+        Yields:
+            (artifact_id, file) tuples, as returned by download_artifact. The
+            caller owns each file and must close it.
+        """
+        if not artifact_ids:
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(artifact_ids)))
+        futures = [executor.submit(self.download_artifact, artifact_id) for artifact_id in artifact_ids]
+        consumed = 0
+        try:
+            for artifact_id, future in zip(artifact_ids, futures):
+                artifact_data = future.result()
+                consumed += 1
+                yield artifact_id, artifact_data
+        finally:
+            # Don't start downloads nobody will consume if the caller stops early or one fails,
+            # and release the ones that already finished
+            pending = futures[consumed:]
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            for future in pending:
+                if not future.cancelled() and future.exception() is None:
+                    future.result().close()
+    
+    def _list_runs(self, url: str, params: Dict[str, Any], limit: int,
+                   run_filter: Optional[Callable[[Dict[str, Any]], bool]] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch up to `limit` runs from a runs endpoint, following rel="next" links.
+        
+        With run_filter, only matching runs are kept and paging continues until
+        `limit` of them are collected or the pages run out.
+        """
+        data, links = self._get_json(url, params=params)
+        runs = list(filter(run_filter, data.get('workflow_runs', [])))
+        
+        # The next link already carries the query parameters
+        while len(runs) < limit:
+            next_url = links.get('next', {}).get('url')
+            if not next_url:
+                break
+            data, links = self._get_json(next_url)
+            runs.extend(filter(run_filter, data.get('workflow_runs', [])))
+        
+        return runs[:limit]
+    
+    def _resolve_workflow_ids(self, workflow_name: str) -> List[int]:
+        """
+        Return the IDs of repository workflows whose name contains workflow_name.
+        
+        The workflow list is fetched once per client and matched locally, which
+        is far cheaper than filtering hundreds of runs by name.
+        """
+        if self._workflows is None:
+            url = f"{self._repo_base}/actions/workflows"
+            data, links = self._get_json(url, params={'per_page': 100})
+            workflows = list(data.get('workflows', []))
+            
+            while 'next' in links:
+                data, links = self._get_json(links['next']['url'])
+                workflows.extend(data.get('workflows', []))
+            
+            self._workflows = workflows
         
-        logger.info(f"Downloaded {len(response.content)} bytes")
-        return response.content
+        pattern = workflow_name.lower()
+        return [workflow['id'] for workflow in self._workflows if pattern in workflow.get('name', '').lower()]
     
     def get_workflow_runs(self, workflow_name: Optional[str] = None, branch: Optional[str] = None, 
                          limit: int = 50) -> List[Dict[str, Any]]:
         """
         Get recent workflow runs, optionally filtered by workflow name or branch.
         
+        A workflow name is resolved to matching workflow IDs so runs are listed
+        from /actions/workflows/{id}/runs and filtered by GitHub. If no workflow
+        matches (e.g. the runs use a custom run-name), the repository-wide run
+        list is paged through and filtered by run name instead. Pages are
+        followed via the Link header's rel="next" until `limit` (matching) runs
+        have been collected.
+        
         Args:
             workflow_name: Optional workflow name to filter by
             branch: Optional branch name to filter by
@@ -183,21 +642,32 @@ class GitHubAPIClient:
         Returns:
             List of workflow run dictionaries
         """
-        url = f"{self.base_url}/repos/{self.config.repo_owner}/{self.config.repo_name}/actions/runs"
+        repo_url = f"{self._repo_base}/actions"
         params = {'per_page': min(limit, 100)}
         
         if branch:
             params['branch'] = branch
-            
-        response = self._make_request(url, params=params)
-        runs_data = response.json()
-        
-        runs = runs_data.get('workflow_runs', [])
         
         if workflow_name:
-            runs = [run for run in runs if workflow_name.lower() in run.get('name', '').lower()]
+            workflow_ids = self._resolve_workflow_ids(workflow_name)
+            if workflow_ids:
+                runs = []
+                for workflow_id in workflow_ids:
+                    runs.extend(self._list_runs(f"{repo_url}/workflows/{workflow_id}/runs", params, limit))
+                
+                # Interleave several matching workflows newest-first, as the repo-wide list is
+                if len(workflow_ids) > 1:
+                    runs.sort(key=lambda run: run.get('created_at', ''), reverse=True)
+                
+                return runs[:limit]
         
-        return runs[:limit]
+        if not workflow_name:
+            return self._list_runs(f"{repo_url}/runs", params, limit)
+        
+        # Matching runs may be sparse in the repository-wide list, so page in full
+        pattern = workflow_name.lower()
+        return self._list_runs(f"{repo_url}/runs", {**params, 'per_page': 100}, limit,
+                               lambda run: pattern in run.get('name', '').lower())
     
     def search_recent_runs_by_pattern(self, pattern: str, limit: int = 20) -> List[Dict[str, Any]]:
         """
@@ -210,14 +680,4 @@ class GitHubAPIClient:
         Returns:
             List of matching workflow runs
         """
-        runs = self.get_workflow_runs(limit=limit * 2)  # Get more to account for filtering
-        
-        matching_runs = []
-        for run in runs:
-            workflow_name = run.get('name', '').lower()
-            if pattern.lower() in workflow_name:
-                matching_runs.append(run)
-                if len(matching_runs) >= limit:
-                    break
-        
-        return matching_runs
\ No newline at end of file
+        return self.get_workflow_runs(workflow_name=pattern, limit=limit)
\ No newline at end of file
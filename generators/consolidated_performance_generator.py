@@ -6,535 +6,236 @@ Combines multiple dynamic_performance_data.csv files from different boards/suite
 into a single comprehensive performance dashboard with comparative analysis.
 """
 
+import bisect
 import csv
+import functools
+import gzip
+import mmap
+import os
+import pickle
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Tuple
-from collections import defaultdict
+from typing import Callable, Iterator, List, Dict, Any, Tuple, Union
+from collections import Counter, defaultdict
 
+_CSV_FILE_NAME = "dynamic_performance_data.csv"
+_BOARD_PREFIXES = ('BFT_', 'CFT_', 'PFT_')
 
-class ConsolidatedPerformanceReportGenerator:
-    """Generate consolidated HTML reports from multiple performance CSV files."""
+# Metric statuses are normalized once at parse time to small integer codes
+_STATUS_PASS = 0
+_STATUS_FAIL = 1
+_STATUS_OTHER = 2
+_STATUS_CODES = {'pass': _STATUS_PASS, 'fail': _STATUS_FAIL}
+
+# __slots__ dataclasses need Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# CSV files smaller than this are parsed in-process; IPC would cost more than the parse
+_PARALLEL_PARSE_MIN_SIZE = 64 * 1024
+
+# CSV files at least this large are read through mmap instead of buffered IO
+_MMAP_MIN_SIZE = 1024 * 1024
+
+# Write buffer for the streamed HTML report
+_HTML_WRITE_BUFFER = 1 << 20
+
+# gzip level for compressed (.html.gz) reports
+_GZIP_COMPRESS_LEVEL = 6
+
+# Board success-rate tiers: a rate at or above _SUCCESS_TIERS[i - 1] and below
+# _SUCCESS_TIERS[i] gets _STATUS_TIER_LABELS[i] as its (css class, text)
+_SUCCESS_TIERS = (80, 90, 95)
+_STATUS_TIER_LABELS = (
+    ('critical', 'Critical'),
+    ('warning', 'Warning'),
+    ('good', 'Good'),
+    ('excellent', 'Excellent'),
+)
+
+# Failures listed per metric in the trends section; the rest are only counted
+_TREND_TOP_FAILURES = 5
+
+# Label prefix on metric parameters, including the misspelt 'statictics' variant
+_BLR_PREFIX_RE = re.compile(r'BLR stati(?:s|c)tics for ')
+
+
+def _prefetch_files(paths: List[str]):
+    """
+    Ask the kernel to start reading all files into the page cache at once.
     
-    def __init__(self):
-        self.all_performance_data = []
-        self.board_summaries = {}
-        
-    def discover_csv_files(self, base_dir: str = "nightly_reports") -> List[Tuple[str, str, str]]:
-        """Discover all dynamic_performance_data.csv files and extract board/suite info."""
-        csv_files = []
-        base_path = Path(base_dir)
-        
-        if not base_path.exists():
-            print(f"❌ Directory not found: {base_dir}")
-            return csv_files
-            
-        # Find all CSV files
-        for csv_file in base_path.rglob("dynamic_performance_data.csv"):
-            # Extract board and suite from path
-            path_parts = csv_file.parts
-            board_name = "Unknown Board"
-            suite_name = "Unknown Suite"
-            
-            # Try to extract board name (e.g., BFT_h743zi_dev)
-            for part in path_parts:
-                if part.startswith(('BFT_', 'CFT_', 'PFT_')) and '_dev' in part:
-                    board_name = part
-                    break
-                    
-            # Try to extract suite name (e.g., suite_BLR_Test_IoT_SNTP)
-            for part in path_parts:
-                if part.startswith('suite_'):
-                    suite_name = part.replace('suite_', '')
-                    break
-                    
-            csv_files.append((str(csv_file), board_name, suite_name))
-            
-        return csv_files
-        
-    def parse_all_csv_files(self, csv_files: List[Tuple[str, str, str]]) -> Dict[str, Any]:
-        """Parse all CSV files and organize by board/suite."""
-        consolidated_data = {
-            'boards': {},
-            'overall_stats': {
-                'total_tests': 0,
-                'total_metrics': 0,
-                'passed_metrics': 0,
-                'failed_metrics': 0,
-                'total_boards': 0,
-                'total_suites': 0
-            }
-        }
-        
-        for csv_file, board_name, suite_name in csv_files:
-            try:
-                print(f"📊 Processing: {board_name} - {suite_name}")
-                suite_data = self.parse_single_csv(csv_file)
-                
-                if board_name not in consolidated_data['boards']:
-                    consolidated_data['boards'][board_name] = {
-                        'suites': {},
-                        'board_stats': {
-                            'total_tests': 0,
-                            'total_metrics': 0,
-                            'passed_metrics': 0,
-                            'failed_metrics': 0
-                        }
-                    }
-                    
-                # Add suite data
-                consolidated_data['boards'][board_name]['suites'][suite_name] = suite_data
-                
-                # Update board stats
-                board_stats = consolidated_data['boards'][board_name]['board_stats']
-                board_stats['total_tests'] += len(suite_data)
-                
-                for test in suite_data:
-                    board_stats['total_metrics'] += len(test['metrics'])
-                    consolidated_data['overall_stats']['total_metrics'] += len(test['metrics'])
-                    
-                    for metric in test['metrics']:
-                        status = metric['status'].lower()
-                        if status == 'pass':
-                            board_stats['passed_metrics'] += 1
-                            consolidated_data['overall_stats']['passed_metrics'] += 1
-                        elif status == 'fail':
-                            board_stats['failed_metrics'] += 1
-                            consolidated_data['overall_stats']['failed_metrics'] += 1
-                        # Note: 'unknown' status metrics are counted in total_metrics but not in pass/fail
-                
-                # Update overall stats
-                consolidated_data['overall_stats']['total_tests'] += len(suite_data)
-                
-            except Exception as e:
-                print(f"❌ Error processing {csv_file}: {e}")
-                
-        # Final stats
-        consolidated_data['overall_stats']['total_boards'] = len(consolidated_data['boards'])
-        consolidated_data['overall_stats']['total_suites'] = sum(
-            len(board_data['suites']) for board_data in consolidated_data['boards'].values()
-        )
-        
-        return consolidated_data
-        
-    def parse_single_csv(self, csv_file_path: str) -> List[Dict[str, Any]]:
-        """Parse a single CSV file (reusing logic from performance_report_generator)."""
-        performance_tests = []
-        current_test = None
-        
-        with open(csv_file_path, 'r', encoding='utf-8') as file:
-            csv_reader = csv.reader(file)
-            
-            for row in csv_reader:
-                if len(row) == 0:
-                    continue
-                    
-                # Check if this is a test header row
-                if len(row) == 1 and 'px_green' in row[0]:
-                    if current_test:
-                        performance_tests.append(current_test)
-                    
-                    # Extract test info
-                    test_info = row[0].strip('"')
-                    current_test = {
-                        'test_name': test_info,
-                        'metrics': []
-                    }
-                    continue
-                
-                # Check for header row
-                if row[0] == 'Class Name':
-                    continue
-                    
-                # Parse metric rows
-                if len(row) >= 5 and current_test:
-                    if row[0].strip():  # Skip empty first columns
-                        continue
-                        
-                    metric = {
-                        'parameter': row[1].strip(),
-                        'before': row[2].strip() if row[2] else 'N/A',
-                        'after': row[3].strip() if row[3] else 'N/A',
-                        'threshold': row[4].strip() if row[4] else 'N/A',
-                        'status': self._calculate_metric_status(
-                            row[3].strip() if row[3] else 'N/A',  # after value
-                            row[4].strip() if row[4] else 'N/A',  # threshold
-                            row[5].strip() if len(row) > 5 else 'Unknown'  # original status
-                        )
-                    }
-                    current_test['metrics'].append(metric)
-            
-            # Add the last test
-            if current_test:
-                performance_tests.append(current_test)
-                
-        return performance_tests
-        
-    def _calculate_metric_status(self, after_value: str, threshold_value: str, original_status: str) -> str:
-        """Calculate pass/fail status based on after value vs threshold comparison."""
-        # If we have a valid original status from CSV, use it as fallback
-        if original_status and original_status.lower() in ['pass', 'fail']:
-            csv_status = original_status.lower()
-        else:
-            csv_status = 'unknown'
-        
-        # Try to calculate status based on threshold comparison
-        if after_value != 'N/A' and threshold_value != 'N/A':
-            try:
-                # Handle numeric comparisons
-                after_num = float(after_value.replace(',', ''))
-                threshold_num = float(threshold_value.replace(',', ''))
-                
-                # For most performance metrics, lower is better (like loop time, memory usage)
-                # If after_value <= threshold, it's a pass
-                calculated_status = 'pass' if after_num <= threshold_num else 'fail'
-                
-                # If CSV status conflicts with calculated status, show both in debug
-                if csv_status != 'unknown' and csv_status != calculated_status:
-                    # Use calculated status but could add a note about CSV mismatch
-                    pass
-                    
-                return calculated_status
-                
-            except (ValueError, TypeError):
-                # If we can't parse numbers, fall back to string comparison or CSV status
-                if after_value == threshold_value:
-                    return 'pass'
-                elif csv_status != 'unknown':
-                    return csv_status
-                else:
-                    return 'unknown'
-        
-        # Fallback to CSV status if available
-        return csv_status if csv_status != 'unknown' else 'unknown'
-        
-    def generate_consolidated_report(self, base_dir: str = "nightly_reports", 
-                                   output_file: str = None) -> str:
-        """Generate consolidated HTML report from all CSV files."""
-        print("🔬 Generating Consolidated Performance Report...")
-        print("=" * 55)
-        
-        # Discover all CSV files
-        csv_files = self.discover_csv_files(base_dir)
-        if not csv_files:
-            print("❌ No performance CSV files found")
-            return ""
-            
-        print(f"Found {len(csv_files)} performance CSV files across boards:")
-        for csv_file, board, suite in csv_files:
-            print(f"   📊 {board} - {suite}")
-            
-        # Parse all data
-        consolidated_data = self.parse_all_csv_files(csv_files)
-        
-        if not output_file:
-            timestamp = datetime.now().strftime('%Y-%m-%d')
-            output_file = f"nightly_reports/consolidated_performance_report_{timestamp}.html"
-            
-        # Generate HTML
-        html_content = self._create_consolidated_html(consolidated_data, csv_files)
-        
-        # Write to file
-        output_path = Path(output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-            
-        print(f"\n✅ Consolidated report generated: {output_file}")
-        return str(output_path.absolute())
-        
-    def _create_consolidated_html(self, data: Dict[str, Any], csv_files: List[Tuple]) -> str:
-        """Create the consolidated HTML report."""
-        html = []
-        
-        # HTML structure
-        html.append("<!DOCTYPE html>")
-        html.append("<html>")
-        html.append("<head>")
-        html.append("<meta charset='utf-8'>")
-        html.append(f"<title>Consolidated BLR Performance Report - {datetime.now().strftime('%Y-%m-%d')}</title>")
-        html.append(self._get_consolidated_css())
-        html.append("</head>")
-        html.append("<body>")
-        
-        # Header
-        html.append("<h1>🔬 Consolidated BLR Performance Dashboard</h1>")
-        html.append(f"<p class='subtitle'>Multi-Board Performance Analysis</p>")
-        html.append(f"<p class='timestamp'>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>")
-        
-        # Overall summary
-        html.append(self._generate_overall_summary(data['overall_stats']))
-        
-        # Board comparison section
-        html.append(self._generate_board_comparison(data['boards']))
-        
-        # Detailed performance metrics
-        html.append(self._generate_detailed_metrics(data['boards']))
-        
-        # Performance trends analysis
-        html.append(self._generate_performance_trends(data['boards']))
-        
-        # Footer
-        html.append("<div class='footer'>")
-        html.append(f"<p>Report consolidates {len(csv_files)} performance test suites across {data['overall_stats']['total_boards']} boards</p>")
-        html.append("<p>🎯 Focus on failed metrics for performance optimization opportunities</p>")
-        html.append("</div>")
-        
-        html.append("</body>")
-        html.append("</html>")
-        
-        return "\n".join(html)
-        
-        
-        return "\n".join(html)
-        
-    def _generate_overall_summary(self, stats: Dict[str, int]) -> str:
-        """Generate overall summary section."""
-        html = []
-        html.append("<div class='summary-section'>")
-        html.append("<h2>📈 Overall Performance Summary</h2>")
-        html.append("<div class='summary-grid'>")
-        
-        # Summary cards
-        cards = [
-            (stats['total_boards'], "Total Boards", "boards"),
-            (stats['total_suites'], "Test Suites", "suites"),
-            (stats['total_tests'], "Total Tests", "tests"),
-            (stats['total_metrics'], "Total Metrics", "metrics"),
-            (stats['passed_metrics'], "Passed Metrics", "pass"),
-            (stats['failed_metrics'], "Failed Metrics", "fail"),
-        ]
-        
-        for value, label, card_type in cards:
-            html.append(f"<div class='summary-card {card_type}'>")
-            html.append(f"<h3>{value}</h3>")
-            html.append(f"<p>{label}</p>")
-            html.append("</div>")
-            
-        html.append("</div>")
-        
-        # Success rate
-        if stats['total_metrics'] > 0:
-            success_rate = (stats['passed_metrics'] / stats['total_metrics']) * 100
-            html.append(f"<div class='success-rate'>")
-            html.append(f"<h3>Overall Success Rate: {success_rate:.1f}%</h3>")
-            html.append(f"<div class='progress-bar'>")
-            html.append(f"<div class='progress-fill' style='width: {success_rate}%'></div>")
-            html.append("</div>")
-            html.append("</div>")
-            
-        html.append("</div>")
-        return "\n".join(html)
-        
-    def _generate_board_comparison(self, boards_data: Dict[str, Any]) -> str:
-        """Generate board-by-board comparison table."""
-        html = []
-        html.append("<div class='board-comparison'>")
-        html.append("<h2>🏗️ Board Performance Comparison</h2>")
-        html.append("<table class='comparison-table'>")
-        html.append("<thead>")
-        html.append("<tr>")
-        html.append("<th>Board</th>")
-        html.append("<th>Test Suites</th>")
-        html.append("<th>Total Tests</th>")
-        html.append("<th>Total Metrics</th>")
-        html.append("<th>Passed</th>")
-        html.append("<th>Failed</th>")
-        html.append("<th>Success Rate</th>")
-        html.append("<th>Status</th>")
-        html.append("</tr>")
-        html.append("</thead>")
-        html.append("<tbody>")
-        
-        for board_name, board_data in boards_data.items():
-            stats = board_data['board_stats']
-            suite_count = len(board_data['suites'])
-            
-            if stats['total_metrics'] > 0:
-                success_rate = (stats['passed_metrics'] / stats['total_metrics']) * 100
-            else:
-                success_rate = 0
-                
-            status_class = "excellent" if success_rate >= 95 else "good" if success_rate >= 90 else "warning" if success_rate >= 80 else "critical"
-            status_text = "Excellent" if success_rate >= 95 else "Good" if success_rate >= 90 else "Warning" if success_rate >= 80 else "Critical"
-            
-            html.append(f"<tr class='{status_class}'>")
-            html.append(f"<td class='board-name'>{self._format_board_name(board_name)}</td>")
-            html.append(f"<td class='center'>{suite_count}</td>")
-            html.append(f"<td class='center'>{stats['total_tests']}</td>")
-            html.append(f"<td class='center'>{stats['total_metrics']}</td>")
-            html.append(f"<td class='center pass'>{stats['passed_metrics']}</td>")
-            html.append(f"<td class='center fail'>{stats['failed_metrics']}</td>")
-            html.append(f"<td class='center'>{success_rate:.1f}%</td>")
-            html.append(f"<td class='center status-{status_class}'>{status_text}</td>")
-            html.append("</tr>")
-            
-        html.append("</tbody>")
-        html.append("</table>")
-        html.append("</div>")
-        
-        return "\n".join(html)
-        
-    def _generate_detailed_metrics(self, boards_data: Dict[str, Any]) -> str:
-        """Generate detailed metrics by board and suite."""
-        html = []
-        html.append("<div class='detailed-metrics'>")
-        html.append("<h2 id='detailed-metrics'>🔍 Detailed Performance Metrics</h2>")
-        
-        for board_name, board_data in boards_data.items():
-            html.append(f"<div class='board-section'>")
-            html.append(f"<h3 class='board-header'>🏗️ {self._format_board_name(board_name)}</h3>")
-            
-            for suite_name, suite_tests in board_data['suites'].items():
-                html.append(f"<div class='suite-section'>")
-                html.append(f"<h4 class='suite-header'>📊 {suite_name.replace('_', ' ').title()}</h4>")
-                
-                # Count suite metrics
-                suite_passed = 0
-                suite_failed = 0
-                suite_total = 0
-                
-                for test in suite_tests:
-                    for metric in test['metrics']:
-                        suite_total += 1
-                        if metric['status'].lower() == 'pass':
-                            suite_passed += 1
-                        elif metric['status'].lower() == 'fail':
-                            suite_failed += 1
-                            
-                suite_success = (suite_passed / suite_total * 100) if suite_total > 0 else 0
-                
-                html.append(f"<div class='suite-summary'>")
-                html.append(f"<span class='suite-stats'>")
-                html.append(f"Tests: {len(suite_tests)} | ")
-                html.append(f"Metrics: {suite_total} | ")
-                html.append(f"<span class='pass'>Passed: {suite_passed}</span> | ")
-                html.append(f"<span class='fail'>Failed: {suite_failed}</span> | ")
-                html.append(f"Success: {suite_success:.1f}%")
-                html.append("</span>")
-                html.append("</div>")
-                
-                # Show failed metrics only for cleaner view
-                failed_metrics = []
-                for test in suite_tests:
-                    for metric in test['metrics']:
-                        if metric['status'].lower() == 'fail':
-                            failed_metrics.append({
-                                'test': test['test_name'],
-                                'metric': metric
-                            })
-                            
-                if failed_metrics:
-                    html.append("<div class='failed-metrics'>")
-                    html.append("<h5>❌ Failed Metrics (Requires Attention):</h5>")
-                    html.append("<ul>")
-                    for failed in failed_metrics:
-                        test_name = failed['test'].split('\\')[-1].split(' ')[0] if '\\' in failed['test'] else failed['test']
-                        param_name = failed['metric']['parameter'].replace('BLR statistics for ', '').replace('BLR statictics for ', '')
-                        html.append(f"<li><strong>{test_name}</strong>: {param_name} - ")
-                        html.append(f"Value: {failed['metric']['after']}, Threshold: {failed['metric']['threshold']}</li>")
-                    html.append("</ul>")
-                    html.append("</div>")
-                else:
-                    html.append("<div class='all-passed'>✅ All metrics passed thresholds</div>")
-                    
-                html.append("</div>")  # suite-section
-            html.append("</div>")  # board-section
-            
-        html.append("</div>")  # detailed-metrics
-        return "\n".join(html)
-        
-    def _generate_performance_trends(self, boards_data: Dict[str, Any]) -> str:
-        """Generate performance trends analysis."""
-        html = []
-        html.append("<div class='trends-section'>")
-        html.append("<h2 id='performance-analysis'>📊 Performance Analysis & Recommendations</h2>")
-        
-        # Collect all failed metrics for analysis
-        critical_metrics = defaultdict(list)
-        
-        for board_name, board_data in boards_data.items():
-            for suite_name, suite_tests in board_data['suites'].items():
-                for test in suite_tests:
-                    for metric in test['metrics']:
-                        if metric['status'].lower() == 'fail':
-                            metric_type = metric['parameter'].replace('BLR statistics for ', '').replace('BLR statictics for ', '')
-                            critical_metrics[metric_type].append({
-                                'board': board_name,
-                                'suite': suite_name,
-                                'value': metric['after'],
-                                'threshold': metric['threshold']
-                            })
-                            
-        if critical_metrics:
-            html.append("<div class='critical-analysis'>")
-            html.append("<h3 id='critical-issues'>🚨 Critical Performance Issues</h3>")
-            
-            for metric_type, failures in critical_metrics.items():
-                html.append(f"<div class='metric-analysis'>")
-                html.append(f"<h4>⚠️ {metric_type}</h4>")
-                html.append(f"<p><strong>Failed on {len(failures)} instances across boards</strong></p>")
-                html.append("<ul>")
-                
-                for failure in failures[:5]:  # Show top 5
-                    board_formatted = self._format_board_name(failure['board'])
-                    html.append(f"<li>{board_formatted} - {failure['suite']}: ")
-                    html.append(f"Value {failure['value']} exceeds threshold {failure['threshold']}</li>")
-                    
-                if len(failures) > 5:
-                    html.append(f"<li><em>... and {len(failures) - 5} more instances</em></li>")
-                    
-                html.append("</ul>")
-                html.append("</div>")
-                
-            html.append("</div>")
-            
-            # Recommendations
-            html.append("<div class='recommendations'>")
-            html.append("<h3>💡 Performance Optimization Recommendations</h3>")
-            html.append("<div class='recommendation-grid'>")
-            
-            recommendations = [
-                ("Memory Usage", "Consider memory optimization techniques and heap management improvements"),
-                ("CPU Utilization", "Review task scheduling and optimize high CPU usage operations"),
-                ("Stack Usage", "Analyze stack requirements and optimize recursive functions"),
-                ("Tasker Loop Time", "Optimize task processing and reduce blocking operations"),
-            ]
-            
-            for title, desc in recommendations:
-                if any(title.lower() in metric.lower() for metric in critical_metrics.keys()):
-                    html.append(f"<div class='recommendation-card priority'>")
-                else:
-                    html.append(f"<div class='recommendation-card'>")
-                html.append(f"<h4>{title}</h4>")
-                html.append(f"<p>{desc}</p>")
-                html.append("</div>")
-                
-            html.append("</div>")
-            html.append("</div>")
-        else:
-            html.append("<div class='excellent-performance'>")
-            html.append("<h3>🎉 Excellent Performance Results</h3>")
-            html.append("<p>All metrics are within acceptable thresholds across all boards and test suites.</p>")
-            html.append("</div>")
-            
-        html.append("</div>")
-        return "\n".join(html)
-        
-    def _format_board_name(self, board_name: str) -> str:
-        """Format board name for display."""
-        if 'h743' in board_name.lower():
-            return "H743 (STM32H743)"
-        elif 'u575' in board_name.lower():
-            return "U575 (STM32U575)" 
-        else:
-            return board_name.replace('BFT_', '').replace('_dev', '').upper()
-            
-    def _get_consolidated_css(self) -> str:
-        """Return CSS styles for consolidated report."""
-        return """
+    On a cold cache this queues every read up front so the device serves them
+    concurrently, instead of one blocking read per file as parsing reaches it.
+    A no-op where posix_fadvise is unavailable (e.g. Windows, macOS).
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue  # Reported when the file is parsed
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class Metric:
+    """One metric row of a performance test."""
+    parameter: str
+    before: str
+    after: str
+    threshold: str
+    status: str
+    status_code: int
+
+
+@contextmanager
+def _open_csv_lines(path: str) -> Iterator[Iterator[str]]:
+    """
+    Open a CSV file for csv.reader.
+    
+    Large files are memory-mapped and handed over one decoded line at a time,
+    skipping the copy through Python's buffered IO layer; smaller files (and
+    empty ones, which cannot be mapped) use a regular text-mode open.
+    """
+    if os.path.getsize(path) < _MMAP_MIN_SIZE:
+        with open(path, 'r', encoding='utf-8') as file:
+            yield file
+        return
+    
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        # UTF-8 never uses the newline byte inside a multi-byte sequence,
+        # so decoding line by line is safe
+        yield map(bytes.decode, iter(mm.readline, b''))
+
+
+def _walk_csv_files(directory: str, dir_mtimes: List[Tuple[str, int]] = None) -> Iterator[str]:
+    """
+    Yield paths of performance CSV files below directory, in the same
+    directory pre-order as Path.rglob, without stat()ing every entry.
+    Symlinked directories are not followed.
+    
+    If dir_mtimes is given, (path, st_mtime_ns) of every directory visited is
+    appended to it, taken before the directory is listed.
+    """
+    if dir_mtimes is not None:
+        dir_mtimes.append((directory, os.stat(directory).st_mtime_ns))
+    
+    subdirs = []
+    found = None
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name == _CSV_FILE_NAME:
+                found = entry.path
+    
+    if found:
+        yield found
+    for subdir in subdirs:
+        yield from _walk_csv_files(subdir, dir_mtimes)
+
+
+# Last CSV listing per base directory: (directory mtimes, CSV paths)
+_CSV_LISTING_CACHE: Dict[str, Tuple[List[Tuple[str, int]], List[str]]] = {}
+
+
+def _list_csv_files(directory: str) -> List[str]:
+    """
+    List performance CSV files below directory, reusing the previous walk
+    while no directory in the tree has changed.
+    
+    Adding, removing or renaming an entry updates the mtime of its parent
+    directory, so one stat() per known directory is enough to validate the
+    cached listing; only a changed tree is walked again.
+    """
+    key = os.path.abspath(directory)
+    cached = _CSV_LISTING_CACHE.get(key)
+    if cached is not None:
+        dir_mtimes, paths = cached
+        try:
+            if all(os.stat(path).st_mtime_ns == mtime for path, mtime in dir_mtimes):
+                return list(paths)
+        except OSError:
+            pass  # A directory went away; walk again
+    
+    dir_mtimes = []
+    paths = list(_walk_csv_files(directory, dir_mtimes))
+    _CSV_LISTING_CACHE[key] = (dir_mtimes, paths)
+    return list(paths)
+
+
+@functools.lru_cache(maxsize=64)
+def _format_board_name_cached(board_name: str) -> str:
+    """Pure board-name formatting behind ConsolidatedPerformanceReportGenerator._format_board_name."""
+    lowered = board_name.lower()
+    if 'h743' in lowered:
+        return "H743 (STM32H743)"
+    elif 'u575' in lowered:
+        return "U575 (STM32U575)" 
+    else:
+        return board_name.replace('BFT_', '').replace('_dev', '').upper()
+
+
+@functools.lru_cache(maxsize=512)
+def _clean_param(parameter: str) -> str:
+    """Strip the 'BLR statistics for ' prefix (and its misspelt variant) from a metric parameter."""
+    return _BLR_PREFIX_RE.sub('', parameter)
+
+# Report skeleton and per-row HTML fragments, filled with str.format
+_REPORT_HEAD_TMPL = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset='utf-8'>
+<title>Consolidated BLR Performance Report - {report_date}</title>
+{css}
+</head>
+<body>
+<h1>🔬 Consolidated BLR Performance Dashboard</h1>
+<p class='subtitle'>Multi-Board Performance Analysis</p>
+<p class='timestamp'>Generated: {generated_at}</p>
+"""
+
+_REPORT_FOOT_TMPL = """<div class='footer'>
+<p>Report consolidates {suite_count} performance test suites across {board_count} boards</p>
+<p>🎯 Focus on failed metrics for performance optimization opportunities</p>
+</div>
+</body>
+</html>
+"""
+
+_SUMMARY_CARD_TMPL = """<div class='summary-card {card_type}'>
+<h3>{value}</h3>
+<p>{label}</p>
+</div>
+"""
+
+_BOARD_ROW_TMPL = """<tr class='{status_class}'>
+<td class='board-name'>{board_label}</td>
+<td class='center'>{suite_count}</td>
+<td class='center'>{stats[total_tests]}</td>
+<td class='center'>{stats[total_metrics]}</td>
+<td class='center pass'>{stats[passed_metrics]}</td>
+<td class='center fail'>{stats[failed_metrics]}</td>
+<td class='center'>{success_rate:.1f}%</td>
+<td class='center status-{status_class}'>{status_text}</td>
+</tr>
+"""
+
+_CONSOLIDATED_CSS = """
         <style>
             html {
                 scroll-behavior: smooth;
@@ -715,110 +416,679 @@ class ConsolidatedPerformanceReportGenerator:
                 padding-bottom: 8px;
             }
             
-            .suite-summary {
-                background: #f8f9fa;
-                padding: 10px 15px;
-                border-radius: 5px;
-                margin: 10px 0;
-            }
+            .suite-summary {
+                background: #f8f9fa;
+                padding: 10px 15px;
+                border-radius: 5px;
+                margin: 10px 0;
+            }
+            
+            .suite-stats {
+                font-size: 0.95em;
+                color: #2c3e50;
+            }
+            
+            .failed-metrics {
+                background: #fff5f5;
+                border-left: 4px solid #e74c3c;
+                padding: 15px;
+                margin: 10px 0;
+            }
+            
+            .failed-metrics ul {
+                margin: 10px 0 0 20px;
+            }
+            
+            .failed-metrics li {
+                margin-bottom: 5px;
+                color: #721c24;
+            }
+            
+            .all-passed {
+                background: #f0f9ff;
+                border-left: 4px solid #27ae60;
+                padding: 10px 15px;
+                color: #155724;
+                font-weight: 500;
+            }
+            
+            .trends-section {
+                background: white;
+                padding: 25px;
+                border-radius: 10px;
+                box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+                margin-bottom: 30px;
+            }
+            
+            .critical-analysis {
+                margin-bottom: 30px;
+            }
+            
+            .metric-analysis {
+                background: #fff8f8;
+                border: 1px solid #f8d7da;
+                border-radius: 5px;
+                padding: 15px;
+                margin-bottom: 15px;
+            }
+            
+            .recommendations {
+                background: #f8f9fa;
+                border-radius: 8px;
+                padding: 20px;
+            }
+            
+            .recommendation-grid {
+                display: grid;
+                grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+                gap: 15px;
+                margin-top: 15px;
+            }
+            
+            .recommendation-card {
+                background: white;
+                padding: 15px;
+                border-radius: 5px;
+                border-left: 4px solid #3498db;
+            }
+            
+            .recommendation-card.priority {
+                border-left-color: #e74c3c;
+                background: #fff8f8;
+            }
+            
+            .excellent-performance {
+                background: #d5f4e6;
+                border: 1px solid #27ae60;
+                border-radius: 8px;
+                padding: 20px;
+                text-align: center;
+            }
+            
+            .footer {
+                text-align: center;
+                margin-top: 40px;
+                padding: 20px;
+                background: white;
+                border-radius: 10px;
+                color: #7f8c8d;
+                box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+            }
+            
+            h2 { color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 10px; }
+            h3 { color: #34495e; }
+            h4 { color: #7f8c8d; }
+        </style>
+        """
+
+
+class ConsolidatedPerformanceReportGenerator:
+    """Generate consolidated HTML reports from multiple performance CSV files."""
+    
+    def __init__(self):
+        self.all_performance_data = []
+        self.board_summaries = {}
+        
+    def discover_csv_files(self, base_dir: str = "nightly_reports") -> List[Tuple[str, str, str]]:
+        """Discover all dynamic_performance_data.csv files and extract board/suite info."""
+        csv_files = []
+        base_path = Path(base_dir)
+        
+        if not base_path.exists():
+            print(f"❌ Directory not found: {base_dir}")
+            return csv_files
+            
+        # Find all CSV files
+        for csv_file in _list_csv_files(str(base_path)):
+            # Extract board and suite from path in a single pass
+            board_name = None
+            suite_name = None
+            
+            for part in csv_file.split(os.sep):
+                # Board name, e.g. BFT_h743zi_dev
+                if board_name is None and part.startswith(_BOARD_PREFIXES) and '_dev' in part:
+                    board_name = part
+                # Suite name, e.g. suite_BLR_Test_IoT_SNTP
+                elif suite_name is None and part.startswith('suite_'):
+                    suite_name = part.replace('suite_', '')
+                
+            csv_files.append((csv_file, board_name or "Unknown Board", suite_name or "Unknown Suite"))
+            
+        return csv_files
+        
+    def parse_all_csv_files(self, csv_files: List[Tuple[str, str, str]]) -> Dict[str, Any]:
+        """Parse all CSV files and organize by board/suite."""
+        consolidated_data = {
+            'boards': {},
+            'overall_stats': {
+                'total_tests': 0,
+                'total_metrics': 0,
+                'passed_metrics': 0,
+                'failed_metrics': 0,
+                'total_boards': 0,
+                'total_suites': 0
+            }
+        }
+        
+        parsed_files = self._parse_csv_files([csv_file for csv_file, _, _ in csv_files])
+        
+        for (csv_file, board_name, suite_name), suite_data in zip(csv_files, parsed_files):
+            try:
+                print(f"📊 Processing: {board_name} - {suite_name}")
+                if isinstance(suite_data, Exception):
+                    raise suite_data
+                
+                if board_name not in consolidated_data['boards']:
+                    consolidated_data['boards'][board_name] = {
+                        'suites': {},
+                        'board_stats': {
+                            'total_tests': 0,
+                            'total_metrics': 0,
+                            'passed_metrics': 0,
+                            'failed_metrics': 0
+                        }
+                    }
+                    
+                # Add suite data
+                consolidated_data['boards'][board_name]['suites'][suite_name] = suite_data
+                
+                # Tally the suite's metric statuses in one pass, then apply the
+                # totals to board and overall stats once
+                status_counts = Counter(
+                    metric.status_code for test in suite_data for metric in test['metrics']
+                )
+                suite_totals = {
+                    'total_tests': len(suite_data),
+                    'total_metrics': sum(status_counts.values()),
+                    'passed_metrics': status_counts[_STATUS_PASS],
+                    'failed_metrics': status_counts[_STATUS_FAIL],
+                    # Note: 'unknown' status metrics are counted in total_metrics but not in pass/fail
+                }
+                
+                # Update board and overall stats
+                board_stats = consolidated_data['boards'][board_name]['board_stats']
+                overall_stats = consolidated_data['overall_stats']
+                for key, count in suite_totals.items():
+                    board_stats[key] += count
+                    overall_stats[key] += count
+                
+            except Exception as e:
+                print(f"❌ Error processing {csv_file}: {e}")
+                
+        # Final stats
+        consolidated_data['overall_stats']['total_boards'] = len(consolidated_data['boards'])
+        consolidated_data['overall_stats']['total_suites'] = sum(
+            len(board_data['suites']) for board_data in consolidated_data['boards'].values()
+        )
+        
+        return consolidated_data
+        
+    def _parse_csv_files(self, csv_file_paths: List[str]) -> List[Union[List[Dict[str, Any]], Exception]]:
+        """
+        Parse CSV files, fanning large ones out to worker processes.
+        
+        Returns one entry per input file, in input order: the parsed tests, or
+        the exception raised while parsing that file.
+        """
+        def parse(csv_file_path: str) -> Union[List[Dict[str, Any]], Exception]:
+            try:
+                return self.parse_single_csv(csv_file_path)
+            except Exception as e:
+                return e
+        
+        _prefetch_files(csv_file_paths)
+        
+        results: List[Union[List[Dict[str, Any]], Exception]] = [[] for _ in csv_file_paths]
+        large = []
+        for index, csv_file_path in enumerate(csv_file_paths):
+            try:
+                is_large = os.path.getsize(csv_file_path) >= _PARALLEL_PARSE_MIN_SIZE
+            except OSError:
+                is_large = False
+            if is_large:
+                large.append(index)
+            else:
+                results[index] = parse(csv_file_path)
+        
+        if len(large) < 2:
+            for index in large:
+                results[index] = parse(csv_file_paths[index])
+            return results
+        
+        try:
+            with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(large))) as executor:
+                futures = {executor.submit(self.parse_single_csv, csv_file_paths[index]): index
+                           for index in large}
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        results[index] = future.result()
+                    except (BrokenProcessPool, pickle.PicklingError) as e:
+                        # The pool, not the file, failed; parse it here instead
+                        print(f"⚠️  Parallel parsing failed for {csv_file_paths[index]} ({e}); parsing serially")
+                        results[index] = parse(csv_file_paths[index])
+                    except Exception as e:
+                        results[index] = e
+        except Exception as e:
+            print(f"⚠️  Parallel parsing unavailable ({e}); parsing serially")
+            for index in large:
+                results[index] = parse(csv_file_paths[index])
+        
+        return results
+    
+    def parse_single_csv(self, csv_file_path: str) -> List[Dict[str, Any]]:
+        """Parse a single CSV file (reusing logic from performance_report_generator)."""
+        performance_tests = []
+        current_test = None
+        metrics = None
+        calculate_status = self._calculate_metric_status
+        intern = sys.intern
+        
+        with _open_csv_lines(csv_file_path) as lines:
+            # csv.reader tokenizes in C; keep the per-row Python work to one
+            # length check, one strip per cell and a single dict build
+            for row in csv.reader(lines):
+                row_len = len(row)
+                if row_len == 0:
+                    continue
+                
+                first = row[0]
+                
+                # Check if this is a test header row
+                if row_len == 1 and 'px_green' in first:
+                    if current_test:
+                        performance_tests.append(current_test)
+                    
+                    # Extract test info
+                    metrics = []
+                    current_test = {
+                        'test_name': first.strip('"'),
+                        'metrics': metrics
+                    }
+                    continue
+                
+                # Header rows ('Class Name') and rows with a non-empty first
+                # column are not metrics; neither is anything before the first test
+                if row_len < 5 or current_test is None or first.strip():
+                    continue
+                
+                # Metric rows are almost always the full six-column schema;
+                # unpack those in one step instead of indexing field by field
+                if row_len == 6:
+                    _, parameter, before, after, threshold, csv_status = row
+                else:
+                    parameter, before, after, threshold = row[1], row[2], row[3], row[4]
+                    csv_status = row[5] if row_len > 5 else 'Unknown'
+                
+                after = after.strip() if after else 'N/A'
+                threshold = threshold.strip() if threshold else 'N/A'
+                status = calculate_status(after, threshold, csv_status.strip())
+                metrics.append(Metric(
+                    # Metric names recur across boards and suites; share one string each
+                    intern(parameter.strip()),
+                    before.strip() if before else 'N/A',
+                    after,
+                    threshold,
+                    status,
+                    _STATUS_CODES.get(status.lower(), _STATUS_OTHER)
+                ))
+            
+            # Add the last test
+            if current_test:
+                performance_tests.append(current_test)
+                
+        return performance_tests
+        
+    def _calculate_metric_status(self, after_value: str, threshold_value: str, original_status: str) -> str:
+        """Calculate pass/fail status based on after value vs threshold comparison."""
+        # If we have a valid original status from CSV, use it as fallback
+        if original_status and original_status.lower() in ['pass', 'fail']:
+            csv_status = original_status.lower()
+        else:
+            csv_status = 'unknown'
+        
+        # Try to calculate status based on threshold comparison
+        if after_value != 'N/A' and threshold_value != 'N/A':
+            try:
+                # Handle numeric comparisons
+                after_num = float(after_value.replace(',', ''))
+                threshold_num = float(threshold_value.replace(',', ''))
+                
+                # For most performance metrics, lower is better (like loop time, memory usage)
+                # If after_value <= threshold, it's a pass
+                calculated_status = 'pass' if after_num <= threshold_num else 'fail'
+                
+                # If CSV status conflicts with calculated status, show both in debug
+                if csv_status != 'unknown' and csv_status != calculated_status:
+                    # Use calculated status but could add a note about CSV mismatch
+                    pass
+                    
+                return calculated_status
+                
+            except (ValueError, TypeError):
+                # If we can't parse numbers, fall back to string comparison or CSV status
+                if after_value == threshold_value:
+                    return 'pass'
+                elif csv_status != 'unknown':
+                    return csv_status
+                else:
+                    return 'unknown'
+        
+        # Fallback to CSV status if available
+        return csv_status if csv_status != 'unknown' else 'unknown'
+        
+    def generate_consolidated_report(self, base_dir: str = "nightly_reports", 
+                                   output_file: str = None, compress: bool = False) -> str:
+        """
+        Generate consolidated HTML report from all CSV files.
+        
+        The report is gzip-compressed while it is written when compress is set
+        or output_file ends in '.gz'; compress adds the '.gz' suffix if missing.
+        """
+        print("🔬 Generating Consolidated Performance Report...")
+        print("=" * 55)
+        
+        # Discover all CSV files
+        csv_files = self.discover_csv_files(base_dir)
+        if not csv_files:
+            print("❌ No performance CSV files found")
+            return ""
             
-            .suite-stats {
-                font-size: 0.95em;
-                color: #2c3e50;
-            }
+        print(f"Found {len(csv_files)} performance CSV files across boards:")
+        for csv_file, board, suite in csv_files:
+            print(f"   📊 {board} - {suite}")
             
-            .failed-metrics {
-                background: #fff5f5;
-                border-left: 4px solid #e74c3c;
-                padding: 15px;
-                margin: 10px 0;
-            }
+        # Parse all data
+        consolidated_data = self.parse_all_csv_files(csv_files)
+        
+        now = datetime.now()
+        if not output_file:
+            timestamp = now.strftime('%Y-%m-%d')
+            output_file = f"nightly_reports/consolidated_performance_report_{timestamp}.html"
+        
+        if compress and not output_file.endswith('.gz'):
+            output_file += '.gz'
             
-            .failed-metrics ul {
-                margin: 10px 0 0 20px;
-            }
+        # Stream HTML straight to file, section by section
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        if output_file.endswith('.gz'):
+            output = gzip.open(output_path, 'wt', encoding='utf-8', compresslevel=_GZIP_COMPRESS_LEVEL)
+        else:
+            output = open(output_path, 'w', encoding='utf-8', buffering=_HTML_WRITE_BUFFER)
+        
+        with output as f:
+            self._write_consolidated_html(consolidated_data, csv_files, f.write, now)
             
-            .failed-metrics li {
-                margin-bottom: 5px;
-                color: #721c24;
-            }
+        print(f"\n✅ Consolidated report generated: {output_file}")
+        return str(output_path.absolute())
+        
+    def _write_consolidated_html(self, data: Dict[str, Any], csv_files: List[Tuple],
+                                 write: Callable[[str], Any], now: datetime):
+        """Write the consolidated HTML report through write, one section at a time, stamped with now."""
+        # HTML structure and header
+        write(_REPORT_HEAD_TMPL.format(report_date=now.strftime('%Y-%m-%d'),
+                                       generated_at=now.strftime('%Y-%m-%d %H:%M:%S'),
+                                       css=self._get_consolidated_css()))
+        
+        # Overall summary
+        self._generate_overall_summary(data['overall_stats'], write)
+        
+        # Board comparison section
+        self._generate_board_comparison(data['boards'], write)
+        
+        # Detailed performance metrics, collecting failures for the trends section
+        critical_metrics = self._generate_detailed_metrics(data['boards'], write)
+        
+        # Performance trends analysis
+        self._generate_performance_trends(critical_metrics, write)
+        
+        # Footer
+        write(_REPORT_FOOT_TMPL.format(suite_count=len(csv_files),
+                                       board_count=data['overall_stats']['total_boards']))
+        
+    def _generate_overall_summary(self, stats: Dict[str, int], write: Callable[[str], Any]):
+        """Write overall summary section."""
+        write("""<div class='summary-section'>
+<h2>📈 Overall Performance Summary</h2>
+<div class='summary-grid'>
+""")
+        
+        # Summary cards
+        cards = [
+            (stats['total_boards'], "Total Boards", "boards"),
+            (stats['total_suites'], "Test Suites", "suites"),
+            (stats['total_tests'], "Total Tests", "tests"),
+            (stats['total_metrics'], "Total Metrics", "metrics"),
+            (stats['passed_metrics'], "Passed Metrics", "pass"),
+            (stats['failed_metrics'], "Failed Metrics", "fail"),
+        ]
+        
+        for value, label, card_type in cards:
+            write(_SUMMARY_CARD_TMPL.format(value=value, label=label, card_type=card_type))
             
-            .all-passed {
-                background: #f0f9ff;
-                border-left: 4px solid #27ae60;
-                padding: 10px 15px;
-                color: #155724;
-                font-weight: 500;
-            }
+        write("</div>\n")
+        
+        # Success rate
+        if stats['total_metrics'] > 0:
+            success_rate = (stats['passed_metrics'] / stats['total_metrics']) * 100
+            write(f"""<div class='success-rate'>
+<h3>Overall Success Rate: {success_rate:.1f}%</h3>
+<div class='progress-bar'>
+<div class='progress-fill' style='width: {success_rate}%'></div>
+</div>
+</div>
+""")
+            
+        write("</div>\n")
+        
+    def _generate_board_comparison(self, boards_data: Dict[str, Any], write: Callable[[str], Any]):
+        """Write board-by-board comparison table."""
+        write("""<div class='board-comparison'>
+<h2>🏗️ Board Performance Comparison</h2>
+<table class='comparison-table'>
+<thead>
+<tr>
+<th>Board</th>
+<th>Test Suites</th>
+<th>Total Tests</th>
+<th>Total Metrics</th>
+<th>Passed</th>
+<th>Failed</th>
+<th>Success Rate</th>
+<th>Status</th>
+</tr>
+</thead>
+<tbody>
+""")
+        
+        for board_name, board_data in boards_data.items():
+            stats = board_data['board_stats']
             
-            .trends-section {
-                background: white;
-                padding: 25px;
-                border-radius: 10px;
-                box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-                margin-bottom: 30px;
-            }
+            if stats['total_metrics'] > 0:
+                success_rate = (stats['passed_metrics'] / stats['total_metrics']) * 100
+            else:
+                success_rate = 0
+                
+            status_class, status_text = _STATUS_TIER_LABELS[bisect.bisect_right(_SUCCESS_TIERS, success_rate)]
             
-            .critical-analysis {
-                margin-bottom: 30px;
-            }
+            write(_BOARD_ROW_TMPL.format(status_class=status_class, status_text=status_text,
+                                         board_label=self._format_board_name(board_name),
+                                         suite_count=len(board_data['suites']),
+                                         stats=stats, success_rate=success_rate))
             
-            .metric-analysis {
-                background: #fff8f8;
-                border: 1px solid #f8d7da;
-                border-radius: 5px;
-                padding: 15px;
-                margin-bottom: 15px;
-            }
+        write("""</tbody>
+</table>
+</div>
+""")
+        
+    def _generate_detailed_metrics(self, boards_data: Dict[str, Any],
+                                   write: Callable[[str], Any]) -> Dict[str, Dict[str, List]]:
+        """
+        Write detailed metrics by board and suite.
+        
+        Returns failed metrics grouped by cleaned parameter name. Each group
+        holds the total failure 'count' and parallel 'boards', 'suites',
+        'values' and 'thresholds' lists for the first _TREND_TOP_FAILURES of them.
+        """
+        critical_metrics = defaultdict(lambda: {'count': 0, 'boards': [], 'suites': [], 'values': [], 'thresholds': []})
+        
+        write("""<div class='detailed-metrics'>
+<h2 id='detailed-metrics'>🔍 Detailed Performance Metrics</h2>
+""")
+        
+        for board_name, board_data in boards_data.items():
+            write(f"""<div class='board-section'>
+<h3 class='board-header'>🏗️ {self._format_board_name(board_name)}</h3>
+""")
             
-            .recommendations {
-                background: #f8f9fa;
-                border-radius: 8px;
-                padding: 20px;
-            }
+            for suite_name, suite_tests in board_data['suites'].items():
+                write(f"""<div class='suite-section'>
+<h4 class='suite-header'>📊 {suite_name.replace('_', ' ').title()}</h4>
+""")
+                
+                # Count suite metrics and collect failed ones in a single pass
+                suite_passed = 0
+                suite_total = 0
+                failed_metrics = []
+                
+                for test in suite_tests:
+                    metrics = test['metrics']
+                    suite_total += len(metrics)
+                    for metric in metrics:
+                        code = metric.status_code
+                        if code == _STATUS_PASS:
+                            suite_passed += 1
+                        elif code == _STATUS_FAIL:
+                            failed_metrics.append((test['test_name'], metric))
+                            bucket = critical_metrics[_clean_param(metric.parameter)]
+                            bucket['count'] += 1
+                            if bucket['count'] <= _TREND_TOP_FAILURES:
+                                bucket['boards'].append(board_name)
+                                bucket['suites'].append(suite_name)
+                                bucket['values'].append(metric.after)
+                                bucket['thresholds'].append(metric.threshold)
+                            
+                suite_failed = len(failed_metrics)
+                suite_success = (suite_passed / suite_total * 100) if suite_total > 0 else 0
+                
+                write(f"""<div class='suite-summary'>
+<span class='suite-stats'>
+Tests: {len(suite_tests)} | 
+Metrics: {suite_total} | 
+<span class='pass'>Passed: {suite_passed}</span> | 
+<span class='fail'>Failed: {suite_failed}</span> | 
+Success: {suite_success:.1f}%
+</span>
+</div>
+""")
+                
+                # Show failed metrics only for cleaner view
+                if failed_metrics:
+                    write("""<div class='failed-metrics'>
+<h5>❌ Failed Metrics (Requires Attention):</h5>
+<ul>
+""")
+                    for failed_test, metric in failed_metrics:
+                        test_name = failed_test.split('\\')[-1].split(' ')[0] if '\\' in failed_test else failed_test
+                        param_name = _clean_param(metric.parameter)
+                        write(f"""<li><strong>{test_name}</strong>: {param_name} - 
+Value: {metric.after}, Threshold: {metric.threshold}</li>
+""")
+                    write("""</ul>
+</div>
+""")
+                else:
+                    write("<div class='all-passed'>✅ All metrics passed thresholds</div>\n")
+                    
+                write("</div>\n")  # suite-section
+            write("</div>\n")  # board-section
             
-            .recommendation-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-                gap: 15px;
-                margin-top: 15px;
-            }
+        write("</div>\n")  # detailed-metrics
+        return critical_metrics
+        
+    def _generate_performance_trends(self, critical_metrics: Dict[str, Dict[str, List]],
+                                     write: Callable[[str], Any]):
+        """Write performance trends analysis from the failures collected by _generate_detailed_metrics."""
+        write("""<div class='trends-section'>
+<h2 id='performance-analysis'>📊 Performance Analysis & Recommendations</h2>
+""")
+        
+        if critical_metrics:
+            write("""<div class='critical-analysis'>
+<h3 id='critical-issues'>🚨 Critical Performance Issues</h3>
+""")
+            
+            for metric_type, bucket in critical_metrics.items():
+                failure_count = bucket['count']
+                write(f"""<div class='metric-analysis'>
+<h4>⚠️ {metric_type}</h4>
+<p><strong>Failed on {failure_count} instances across boards</strong></p>
+<ul>
+""")
+                
+                top_failures = zip(bucket['boards'], bucket['suites'], bucket['values'], bucket['thresholds'])
+                for board, suite, value, threshold in top_failures:
+                    board_formatted = self._format_board_name(board)
+                    write(f"""<li>{board_formatted} - {suite}: 
+Value {value} exceeds threshold {threshold}</li>
+""")
+                    
+                if failure_count > _TREND_TOP_FAILURES:
+                    write(f"<li><em>... and {failure_count - _TREND_TOP_FAILURES} more instances</em></li>\n")
+                    
+                write("""</ul>
+</div>
+""")
+                
+            write("""</div>
+<div class='recommendations'>
+<h3>💡 Performance Optimization Recommendations</h3>
+<div class='recommendation-grid'>
+""")
             
-            .recommendation-card {
-                background: white;
-                padding: 15px;
-                border-radius: 5px;
-                border-left: 4px solid #3498db;
-            }
+            recommendations = [
+                ("Memory Usage", "Consider memory optimization techniques and heap management improvements"),
+                ("CPU Utilization", "Review task scheduling and optimize high CPU usage operations"),
+                ("Stack Usage", "Analyze stack requirements and optimize recursive functions"),
+                ("Tasker Loop Time", "Optimize task processing and reduce blocking operations"),
+            ]
             
-            .recommendation-card.priority {
-                border-left-color: #e74c3c;
-                background: #fff8f8;
-            }
+            # Lowercase the failed metric names once; titles hold no newline,
+            # so a match in the joined text is a match within a single name
+            failed_names = '\n'.join(critical_metrics).lower()
             
-            .excellent-performance {
-                background: #d5f4e6;
-                border: 1px solid #27ae60;
-                border-radius: 8px;
-                padding: 20px;
-                text-align: center;
-            }
+            for title, desc in recommendations:
+                if title.lower() in failed_names:
+                    card_class = "recommendation-card priority"
+                else:
+                    card_class = "recommendation-card"
+                write(f"""<div class='{card_class}'>
+<h4>{title}</h4>
+<p>{desc}</p>
+</div>
+""")
+                
+            write("""</div>
+</div>
+""")
+        else:
+            write("""<div class='excellent-performance'>
+<h3>🎉 Excellent Performance Results</h3>
+<p>All metrics are within acceptable thresholds across all boards and test suites.</p>
+</div>
+""")
             
-            .footer {
-                text-align: center;
-                margin-top: 40px;
-                padding: 20px;
-                background: white;
-                border-radius: 10px;
-                color: #7f8c8d;
-                box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-            }
+        write("</div>\n")
+        
+    def _format_board_name(self, board_name: str) -> str:
+        """Format board name for display."""
+        return _format_board_name_cached(board_name)
             
-            h2 { color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 10px; }
-            h3 { color: #34495e; }
-            h4 { color: #7f8c8d; }
-        </style>
-        """
+    def _get_consolidated_css(self) -> str:
+        """Return CSS styles for consolidated report."""
+        return _CONSOLIDATED_CSS
 
 
 def main():
@@ -830,11 +1100,13 @@ def main():
                        help='Base directory to search for CSV files')
     parser.add_argument('--output', default=None,
                        help='Output HTML file path')
+    parser.add_argument('--gzip', action='store_true',
+                       help='Write the report gzip-compressed (.html.gz)')
     
     args = parser.parse_args()
     
     generator = ConsolidatedPerformanceReportGenerator()
-    output_file = generator.generate_consolidated_report(args.base_dir, args.output)
+    output_file = generator.generate_consolidated_report(args.base_dir, args.output, compress=args.gzip)
     
     if output_file:
         print(f"\n🌐 Open in browser: file://{output_file}")
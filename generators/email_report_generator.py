@@ -5,13 +5,76 @@ This module provides email-friendly report formats commonly used for
 nightly test reporting and team communication.
 """
 
+import functools
+import io
 import logging
-from typing import Dict, List, Any
+import re
+from operator import attrgetter
+from typing import Dict, List, Any, Optional, TextIO, Tuple
 from datetime import datetime
 from artifact_processor import TestSuiteResult, TestResult
 
 logger = logging.getLogger(__name__)
 
+# Overall stats keys, which are also the TestSuiteResult count attributes
+_STAT_FIELDS = ('total', 'passed', 'failed', 'skipped', 'errors')
+_suite_counts = attrgetter(*_STAT_FIELDS)
+
+
+def _results_fingerprint(test_results: Dict[str, Dict[str, TestSuiteResult]]) -> Tuple:
+    """
+    Per-suite summary of test_results that changes whenever an artifact or
+    suite is added, removed or replaced, or a suite's counts or recorded tests
+    change. Much cheaper than walking the individual tests.
+    """
+    return tuple(
+        (artifact_name, suite_name, id(suite_result), len(suite_result.test_statuses), _suite_counts(suite_result))
+        for artifact_name, suites in test_results.items()
+        for suite_name, suite_result in suites.items()
+    )
+
+# Prefixes/suffixes dropped from artifact names, removed in a single scan
+_ARTIFACT_NAME_NOISE_RE = re.compile(r'-test-results|_results|artifact_|pytest_')
+_SEPARATORS_TO_SPACES = str.maketrans('-_', '  ')
+
+# Report for runs without any test results (artifacts missing or all filtered out)
+_EMPTY_REPORT_TMPL = """⚠️ NO TEST RESULTS - {date}
+
+No test results were found for this run.
+
+⚡ Workflow: {workflow}
+🌿 Branch: {branch}
+🔗 Run ID: {run_id}
+"""
+
+@functools.lru_cache(maxsize=4096)
+def _clean_artifact_name_cached(name: str) -> str:
+    """Pure artifact-name cleanup behind EmailReportGenerator._clean_artifact_name."""
+    # Remove common prefixes/suffixes
+    clean = _ARTIFACT_NAME_NOISE_RE.sub('', name)
+    
+    # Handle compound names
+    if '::' in clean:
+        parts = clean.split('::')
+        return f"{parts[0].title()}-{parts[1].title()}"
+    
+    return clean.translate(_SEPARATORS_TO_SPACES).title()
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_test_name_cached(name: str) -> str:
+    """Pure test-name cleanup behind EmailReportGenerator._clean_test_name."""
+    # Remove file paths and keep just the test name
+    if '::' in name:
+        return name.rpartition('::')[2]  # Last part is usually the test name
+    
+    # Remove test_ prefix if present
+    if name.startswith('test_'):
+        name = name[5:]
+    
+    # Replace underscores with spaces
+    return name.replace('_', ' ').title()
+
 
 class EmailReportGenerator:
     """Generates email-friendly test reports for team communication."""
@@ -19,6 +82,10 @@ class EmailReportGenerator:
     def __init__(self, config):
         """Initialize email report generator."""
         self.config = config
+        # (test_results, fingerprint, stats, failures, report time) for the last
+        # results seen; the report variants are generated back to back from the
+        # same results
+        self._stats_cache = None
     
     def generate_executive_summary(self, run_info: Dict[str, Any], 
                                  test_results: Dict[str, Dict[str, TestSuiteResult]], 
@@ -28,7 +95,11 @@ class EmailReportGenerator:
         
         Format: Concise, high-level overview with key metrics
         """
+        if not test_results:
+            return self._generate_empty_report(run_info, run_id)
+        
         overall_stats = self._calculate_overall_stats(test_results)
+        report_time = self._report_time(test_results)
         
         # Determine overall status
         if overall_stats['failed'] == 0 and overall_stats['errors'] == 0:
@@ -43,59 +114,66 @@ class EmailReportGenerator:
         if overall_stats['total'] > 0:
             pass_rate = (overall_stats['passed'] / overall_stats['total']) * 100
         
-        report_lines = [
-            f"=== NIGHTLY TEST REPORT - {datetime.now().strftime('%Y-%m-%d')} ===",
-            "",
-            f"🎯 OVERALL STATUS: {status_icon}",
-            f"📊 PASS RATE: {pass_rate:.1f}% ({overall_stats['passed']}/{overall_stats['total']})",
-            f"⚡ WORKFLOW: {run_info.get('name', 'Unknown')}",
-            f"🌿 BRANCH: {run_info.get('head_branch', 'main')}",
-            f"🔗 RUN ID: {run_id}",
-            "",
-            "📈 QUICK STATS:",
-            f"   • Total Tests: {overall_stats['total']}",
-            f"   • Passed: {overall_stats['passed']} ✅",
-            f"   • Failed: {overall_stats['failed']} ❌" if overall_stats['failed'] > 0 else "",
-            f"   • Skipped: {overall_stats['skipped']} ⏭️" if overall_stats['skipped'] > 0 else "",
-            f"   • Errors: {overall_stats['errors']} ⚠️" if overall_stats['errors'] > 0 else "",
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        
+        w(f"=== NIGHTLY TEST REPORT - {report_time.strftime('%Y-%m-%d')} ===\n"
+          f"🎯 OVERALL STATUS: {status_icon}\n"
+          f"📊 PASS RATE: {pass_rate:.1f}% ({overall_stats['passed']}/{overall_stats['total']})\n"
+          f"⚡ WORKFLOW: {run_info.get('name', 'Unknown')}\n"
+          f"🌿 BRANCH: {run_info.get('head_branch', 'main')}\n"
+          f"🔗 RUN ID: {run_id}\n"
+          "📈 QUICK STATS:\n"
+          f"   • Total Tests: {overall_stats['total']}\n"
+          f"   • Passed: {overall_stats['passed']} ✅\n")
         
-        # Filter out empty lines
-        report_lines = [line for line in report_lines if line != ""]
+        # Only list the non-zero problem counts
+        if overall_stats['failed'] > 0:
+            w(f"   • Failed: {overall_stats['failed']} ❌\n")
+        if overall_stats['skipped'] > 0:
+            w(f"   • Skipped: {overall_stats['skipped']} ⏭️\n")
+        if overall_stats['errors'] > 0:
+            w(f"   • Errors: {overall_stats['errors']} ⚠️\n")
         
         if overall_stats['failed'] > 0 or overall_stats['errors'] > 0:
-            report_lines.extend([
-                "",
-                "🚨 ACTION REQUIRED:",
-                "   Please review failed tests and create appropriate bug reports.",
-                f"   Detailed failure analysis attached below."
-            ])
-        
-        return "\n".join(report_lines)
+            w("\n"
+              "🚨 ACTION REQUIRED:\n"
+              "   Please review failed tests and create appropriate bug reports.\n"
+              "   Detailed failure analysis attached below.\n")
+        
+        return buf.getvalue()
     
     def generate_team_summary(self, run_info: Dict[str, Any], 
                             test_results: Dict[str, Dict[str, TestSuiteResult]], 
-                            run_id: str) -> str:
+                            run_id: str, out: TextIO = None) -> Optional[str]:
         """
         Generate team-oriented summary with module breakdown.
         
         Format: Module-by-module breakdown for team leads
+        
+        If out is given the report is written to it as it is built and None is
+        returned; otherwise the report is returned as a string.
         """
-        overall_stats = self._calculate_overall_stats(test_results)
+        if not test_results:
+            return self._deliver(self._generate_empty_report(run_info, run_id), out)
         
-        report_lines = [
-            f"📧 TEAM TEST SUMMARY - {datetime.now().strftime('%B %d, %Y')}",
-            "=" * 60,
-            "",
-            f"Workflow: {run_info.get('name', 'Unknown')}",
-            f"Run ID: {run_id}",
-            f"Branch: {run_info.get('head_branch', 'main')}",
-            f"Commit: {run_info.get('head_sha', 'Unknown')[:8]}",
-            f"Date: {run_info.get('created_at', 'Unknown')}",
-            "",
-            "MODULE BREAKDOWN:",
-            "-" * 20
-        ]
+        overall_stats = self._calculate_overall_stats(test_results)
+        report_time = self._report_time(test_results)
+        
+        buf = io.StringIO() if out is None else out
+        w = buf.write
+        
+        w(f"📧 TEAM TEST SUMMARY - {report_time.strftime('%B %d, %Y')}\n"
+          f"{'=' * 60}\n"
+          "\n"
+          f"Workflow: {run_info.get('name', 'Unknown')}\n"
+          f"Run ID: {run_id}\n"
+          f"Branch: {run_info.get('head_branch', 'main')}\n"
+          f"Commit: {run_info.get('head_sha', 'Unknown')[:8]}\n"
+          f"Date: {run_info.get('created_at', 'Unknown')}\n"
+          "\n"
+          "MODULE BREAKDOWN:\n"
+          f"{'-' * 20}\n")
         
         # Group by test module/suite
         for artifact_name, suites in test_results.items():
@@ -104,105 +182,109 @@ class EmailReportGenerator:
             
             # Clean up artifact name for display
             clean_name = self._clean_artifact_name(artifact_name)
-            report_lines.append(f"\n📦 {clean_name.upper()}:")
+            w(f"\n📦 {clean_name.upper()}:\n")
             
             for suite_name, suite_result in suites.items():
                 status_icon = "✅" if suite_result.failed == 0 and suite_result.errors == 0 else "❌"
                 
-                report_lines.append(f"  {status_icon} {suite_name}:")
-                report_lines.append(f"     Total: {suite_result.total} | "
-                                  f"Passed: {suite_result.passed} | "
-                                  f"Failed: {suite_result.failed}")
+                w(f"  {status_icon} {suite_name}:\n"
+                  f"     Total: {suite_result.total} | "
+                  f"Passed: {suite_result.passed} | "
+                  f"Failed: {suite_result.failed}\n")
                 
                 if suite_result.failed > 0:
-                    failed_tests = [t for t in suite_result.tests if t.status in ['failed', 'error']]
-                    report_lines.append(f"     ⚠️  FAILURES ({len(failed_tests)}):")
-                    for i, test in enumerate(failed_tests[:5], 1):  # Limit to first 5
-                        clean_test_name = self._clean_test_name(test.name)
-                        report_lines.append(f"        {i}. {clean_test_name}")
+                    failed_tests = suite_result.failed_tests
+                    failure_count = len(failed_tests)
+                    clean_test_name = self._clean_test_name
+                    # Header plus the first 5 failures in a single write
+                    w(f"     ⚠️  FAILURES ({failure_count}):\n"
+                      + "".join(f"        {i}. {clean_test_name(test.name)}\n"
+                                for i, test in enumerate(failed_tests[:5], 1)))
                     
-                    if len(failed_tests) > 5:
-                        report_lines.append(f"        ... and {len(failed_tests) - 5} more")
+                    if failure_count > 5:
+                        w(f"        ... and {failure_count - 5} more\n")
         
         # Overall summary at bottom
-        report_lines.extend([
-            "",
-            "=" * 60,
-            "🎯 OVERALL RESULTS:",
-            f"   Total Tests: {overall_stats['total']}",
-            f"   Success Rate: {(overall_stats['passed']/max(overall_stats['total'], 1)*100):.1f}%",
-            f"   Tests Requiring Attention: {overall_stats['failed'] + overall_stats['errors']}"
-        ])
+        w("\n"
+          f"{'=' * 60}\n"
+          "🎯 OVERALL RESULTS:\n"
+          f"   Total Tests: {overall_stats['total']}\n"
+          f"   Success Rate: {(overall_stats['passed']/max(overall_stats['total'], 1)*100):.1f}%\n"
+          f"   Tests Requiring Attention: {overall_stats['failed'] + overall_stats['errors']}\n")
         
         if overall_stats['failed'] > 0:
-            report_lines.append(f"\n🔧 Next Steps: Review failures and create bug reports as needed.")
+            w("\n🔧 Next Steps: Review failures and create bug reports as needed.\n")
         
-        return "\n".join(report_lines)
+        return buf.getvalue() if out is None else None
     
     def generate_failure_focused_report(self, run_info: Dict[str, Any], 
                                       test_results: Dict[str, Dict[str, TestSuiteResult]], 
-                                      run_id: str) -> str:
+                                      run_id: str, out: TextIO = None) -> Optional[str]:
         """
         Generate failure-focused report for bug triage.
         
         Format: Detailed failure information for creating bug reports
-        """
-        all_failures = self._get_all_failures(test_results)
-        overall_stats = self._calculate_overall_stats(test_results)
-        
-        if not any(failures for failures in all_failures.values()):
-            return self._generate_success_report(run_info, overall_stats, run_id)
         
-        report_lines = [
-            f"🐛 FAILURE ANALYSIS REPORT - {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-            "=" * 70,
-            "",
-            f"Run ID: {run_id}",
-            f"Workflow: {run_info.get('name', 'Unknown')}",
-            f"Branch: {run_info.get('head_branch', 'main')}",
-            f"Total Failures: {overall_stats['failed'] + overall_stats['errors']}",
-            "",
-            "🔍 FAILURES BY MODULE:",
-            "=" * 25
-        ]
+        If out is given the report is written to it as it is built and None is
+        returned; otherwise the report is returned as a string.
+        """
+        if not test_results:
+            return self._deliver(self._generate_empty_report(run_info, run_id), out)
+        
+        overall_stats, all_failures = self._stats_and_failures(test_results)
+        report_time = self._report_time(test_results)
+        
+        # Only suites with at least one failed test get an entry
+        if not all_failures:
+            return self._deliver(self._generate_success_report(run_info, overall_stats, run_id, report_time), out)
+        
+        buf = io.StringIO() if out is None else out
+        w = buf.write
+        
+        w(f"🐛 FAILURE ANALYSIS REPORT - {report_time.strftime('%Y-%m-%d %H:%M')}\n"
+          f"{'=' * 70}\n"
+          "\n"
+          f"Run ID: {run_id}\n"
+          f"Workflow: {run_info.get('name', 'Unknown')}\n"
+          f"Branch: {run_info.get('head_branch', 'main')}\n"
+          f"Total Failures: {overall_stats['failed'] + overall_stats['errors']}\n"
+          "\n"
+          "🔍 FAILURES BY MODULE:\n"
+          f"{'=' * 25}\n")
         
         for suite_name, failures in all_failures.items():
             if not failures:
                 continue
             
             clean_suite = self._clean_artifact_name(suite_name)
-            report_lines.extend([
-                f"\n📋 {clean_suite}: {len(failures)} failed",
-                "-" * (len(clean_suite) + 20)
-            ])
+            w(f"\n📋 {clean_suite}: {len(failures)} failed\n"
+              f"{'-' * (len(clean_suite) + 20)}\n")
             
             for i, test in enumerate(failures, 1):
                 clean_test_name = self._clean_test_name(test.name)
-                report_lines.append(f"{i:2d}. {clean_test_name}")
+                w(f"{i:2d}. {clean_test_name}\n")
                 
                 # Add error details if available
                 error_msg = test.failure_message or test.error_message
                 if error_msg:
                     # Clean and truncate error message
                     clean_error = self._clean_error_message(error_msg)
-                    report_lines.append(f"    💬 {clean_error}")
+                    w(f"    💬 {clean_error}\n")
                 
-                report_lines.append("")  # Empty line between tests
+                w("\n")  # Empty line between tests
         
         # Add summary for bug creation
-        report_lines.extend([
-            "=" * 70,
-            "📝 FOR BUG CREATION:",
-            "  • Review each failure above",
-            "  • Check if similar issues exist in bug tracker", 
-            "  • Create new bugs for genuine failures",
-            "  • Update existing bugs for regressions",
-            "",
-            f"📊 Quick Stats: {overall_stats['passed']} passed, "
-            f"{overall_stats['failed']} failed, {overall_stats['skipped']} skipped"
-        ])
-        
-        return "\n".join(report_lines)
+        w(f"{'=' * 70}\n"
+          "📝 FOR BUG CREATION:\n"
+          "  • Review each failure above\n"
+          "  • Check if similar issues exist in bug tracker\n"
+          "  • Create new bugs for genuine failures\n"
+          "  • Update existing bugs for regressions\n"
+          "\n"
+          f"📊 Quick Stats: {overall_stats['passed']} passed, "
+          f"{overall_stats['failed']} failed, {overall_stats['skipped']} skipped\n")
+        
+        return buf.getvalue() if out is None else None
     
     def generate_slack_summary(self, run_info: Dict[str, Any], 
                              test_results: Dict[str, Dict[str, TestSuiteResult]], 
@@ -210,7 +292,11 @@ class EmailReportGenerator:
         """
         Generate Slack-friendly summary (short, with emojis).
         """
+        if not test_results:
+            return self._generate_empty_report(run_info, run_id)
+        
         overall_stats = self._calculate_overall_stats(test_results)
+        report_time = self._report_time(test_results)
         
         if overall_stats['failed'] == 0 and overall_stats['errors'] == 0:
             status = "✅ ALL TESTS PASSED! 🎉"
@@ -219,23 +305,33 @@ class EmailReportGenerator:
         
         pass_rate = (overall_stats['passed'] / max(overall_stats['total'], 1)) * 100
         
-        return f"""🤖 *Nightly Test Results* - {datetime.now().strftime('%Y-%m-%d')}
+        lines = [
+            f"🤖 *Nightly Test Results* - {report_time.strftime('%Y-%m-%d')}",
+            "",
+            status,
+            "",
+            f"📊 *Summary:* {overall_stats['passed']}/{overall_stats['total']} passed ({pass_rate:.1f}%)",
+            f"🌿 *Branch:* {run_info.get('head_branch', 'main')}",
+            f"🔗 *Run ID:* {run_id}",
+        ]
         
-{status}
-
-📊 *Summary:* {overall_stats['passed']}/{overall_stats['total']} passed ({pass_rate:.1f}%)
-🌿 *Branch:* {run_info.get('head_branch', 'main')}
-🔗 *Run ID:* {run_id}
-
-{f'🐛 *Failed Tests:* {overall_stats["failed"]}' if overall_stats['failed'] > 0 else ''}
-{f'⏭️  *Skipped:* {overall_stats["skipped"]}' if overall_stats['skipped'] > 0 else ''}
-"""
+        # Detail lines only for non-zero counts, so green runs end without blank lines
+        details = []
+        if overall_stats['failed'] > 0:
+            details.append(f"🐛 *Failed Tests:* {overall_stats['failed']}")
+        if overall_stats['skipped'] > 0:
+            details.append(f"⏭️  *Skipped:* {overall_stats['skipped']}")
+        if details:
+            lines.append("")
+            lines.extend(details)
+        
+        return "\n".join(lines)
     
     def _generate_success_report(self, run_info: Dict[str, Any], 
                                overall_stats: Dict[str, int], 
-                               run_id: str) -> str:
+                               run_id: str, report_time: datetime) -> str:
         """Generate success report when no failures."""
-        return f"""🎉 SUCCESS REPORT - {datetime.now().strftime('%Y-%m-%d %H:%M')}
+        return f"""🎉 SUCCESS REPORT - {report_time.strftime('%Y-%m-%d %H:%M')}
         
 ✅ ALL TESTS PASSED! 
 
@@ -247,70 +343,94 @@ class EmailReportGenerator:
 🚀 No action required - all systems are green!
 """
     
+    def _generate_empty_report(self, run_info: Dict[str, Any], run_id: str) -> str:
+        """Generate report when no test results were collected for the run."""
+        return _EMPTY_REPORT_TMPL.format(
+            date=datetime.now().strftime('%Y-%m-%d %H:%M'),
+            workflow=run_info.get('name', 'Unknown'),
+            branch=run_info.get('head_branch', 'main'),
+            run_id=run_id,
+        )
+    
     # Helper methods
-    def _calculate_overall_stats(self, test_results: Dict[str, Dict[str, TestSuiteResult]]) -> Dict[str, int]:
-        """Calculate overall statistics across all test suites."""
-        stats = {'total': 0, 'passed': 0, 'failed': 0, 'skipped': 0, 'errors': 0}
+    @staticmethod
+    def _deliver(report: str, out: Optional[TextIO]) -> Optional[str]:
+        """Return a finished report, or write it to out and return None."""
+        if out is None:
+            return report
+        out.write(report)
+        return None
+    
+    def _stats_and_failures(self, test_results: Dict[str, Dict[str, TestSuiteResult]]
+                            ) -> Tuple[Dict[str, int], Dict[str, List[TestResult]]]:
+        """
+        Calculate overall statistics and collect failed tests by suite in one
+        walk over all test suites.
         
-        for artifact_name, suites in test_results.items():
-            for suite_name, suite_result in suites.items():
-                stats['total'] += suite_result.total
-                stats['passed'] += suite_result.passed
-                stats['failed'] += suite_result.failed
-                stats['skipped'] += suite_result.skipped
-                stats['errors'] += suite_result.errors
+        The result is kept for the last test_results seen, so generating several
+        report variants from the same results walks them only once. It is
+        reused only while the results' fingerprint is unchanged, so results
+        updated in place between calls are walked again.
+        """
+        fingerprint = _results_fingerprint(test_results)
+        cached = self._stats_cache
+        if cached is not None and cached[0] is test_results and cached[1] == fingerprint:
+            return cached[2], cached[3]
         
-        return stats
-    
-    def _get_all_failures(self, test_results: Dict[str, Dict[str, TestSuiteResult]]) -> Dict[str, List[TestResult]]:
-        """Extract all failed tests organized by suite."""
+        report_time = datetime.now()
+        
+        suite_counts = []
         all_failures = {}
         
         for artifact_name, suites in test_results.items():
             for suite_name, suite_result in suites.items():
-                failures = [t for t in suite_result.tests if t.status in ['failed', 'error']]
+                suite_counts.append(_suite_counts(suite_result))
+                
+                failures = suite_result.failed_tests
                 if failures:
                     # Create readable key
                     key = self._clean_artifact_name(f"{artifact_name}::{suite_name}")
                     all_failures[key] = failures
         
-        return all_failures
+        # Column sums over the (suites x fields) count table
+        stats = dict.fromkeys(_STAT_FIELDS, 0)
+        if suite_counts:
+            stats.update(zip(_STAT_FIELDS, map(sum, zip(*suite_counts))))
+        
+        self._stats_cache = (test_results, fingerprint, stats, all_failures, report_time)
+        return stats, all_failures
+    
+    def _report_time(self, test_results: Dict[str, Dict[str, TestSuiteResult]]) -> datetime:
+        """
+        Timestamp shared by every report variant generated from test_results,
+        taken when those results are first seen.
+        """
+        self._stats_and_failures(test_results)
+        return self._stats_cache[4]
+    
+    def _calculate_overall_stats(self, test_results: Dict[str, Dict[str, TestSuiteResult]]) -> Dict[str, int]:
+        """Calculate overall statistics across all test suites."""
+        return self._stats_and_failures(test_results)[0]
+    
+    def _get_all_failures(self, test_results: Dict[str, Dict[str, TestSuiteResult]]) -> Dict[str, List[TestResult]]:
+        """Extract all failed tests organized by suite."""
+        return self._stats_and_failures(test_results)[1]
     
     def _clean_artifact_name(self, name: str) -> str:
         """Clean artifact name for display."""
-        # Remove common prefixes/suffixes
-        clean = name.replace('-test-results', '').replace('_results', '')
-        clean = clean.replace('artifact_', '').replace('pytest_', '')
-        
-        # Handle compound names
-        if '::' in clean:
-            parts = clean.split('::')
-            return f"{parts[0].title()}-{parts[1].title()}"
-        
-        return clean.replace('-', ' ').replace('_', ' ').title()
+        return _clean_artifact_name_cached(name)
     
     def _clean_test_name(self, name: str) -> str:
         """Clean test name for readability."""
-        # Remove file paths and keep just the test name
-        if '::' in name:
-            parts = name.split('::')
-            return parts[-1]  # Last part is usually the test name
-        
-        # Remove test_ prefix if present
-        if name.startswith('test_'):
-            name = name[5:]
-        
-        # Replace underscores with spaces
-        return name.replace('_', ' ').title()
+        return _clean_test_name_cached(name)
     
     def _clean_error_message(self, message: str) -> str:
         """Clean and truncate error message."""
         if not message:
             return "No error details available"
         
-        # Take first line or first 100 characters
-        lines = message.strip().split('\n')
-        first_line = lines[0].strip()
+        # Take first line or first 100 characters; only the first line is split off
+        first_line = message.strip().partition('\n')[0].strip()
         
         if len(first_line) > 100:
             return first_line[:97] + "..."
@@ -116,9 +116,10 @@ def main():
         # Step 2: Download and extract artifacts
         logger.info("Downloading and extracting artifacts...")
         extracted_data = {}
+        pytest_artifacts = {}
         
         for artifact in artifacts:
-            artifact_name = artifact['name']
+            artifact_name = artifact.name
             logger.info(f"Checking artifact: {artifact_name}")
             
             # Only process artifacts that start with "PyTest test_report="
@@ -127,12 +128,15 @@ def main():
                 continue
             
             logger.info(f"Processing PyTest artifact: {artifact_name}")
-            
-            # Download and extract artifact
-            artifact_data = github_client.download_artifact(artifact['id'])
-            extracted_files = artifact_processor.extract_artifact(
-                artifact_data, artifact_name, output_dir
-            )
+            pytest_artifacts[artifact.id] = artifact
+        
+        # Download concurrently; each artifact is extracted as soon as it is its turn
+        for artifact_id, artifact_data in github_client.download_artifacts_bulk(list(pytest_artifacts)):
+            artifact_name = pytest_artifacts[artifact_id].name
+            with artifact_data:
+                extracted_files = artifact_processor.extract_artifact(
+                    artifact_data, artifact_name, output_dir
+                )
             
             extracted_data[artifact_name] = extracted_files
         
@@ -189,17 +193,15 @@ def main():
             logger.info(f"Executive summary saved to: {exec_file}")
         
         if args.report_type in ["team", "all"]:
-            team_report = email_generator.generate_team_summary(run_info, all_test_results, run_id)
             team_file = output_dir / f"team_summary_run_{run_id}.txt"
             with open(team_file, 'w', encoding='utf-8') as f:
-                f.write(team_report)
+                email_generator.generate_team_summary(run_info, all_test_results, run_id, out=f)
             logger.info(f"Team summary saved to: {team_file}")
         
         if args.report_type in ["failure", "all"]:
-            failure_report = email_generator.generate_failure_focused_report(run_info, all_test_results, run_id)
             failure_file = output_dir / f"failure_analysis_run_{run_id}.txt"
             with open(failure_file, 'w', encoding='utf-8') as f:
-                f.write(failure_report)
+                email_generator.generate_failure_focused_report(run_info, all_test_results, run_id, out=f)
             logger.info(f"Failure analysis saved to: {failure_file}")
         
         if args.report_type in ["slack", "all"]:
@@ -234,9 +236,10 @@ def main():
         elif args.report_type == "executive":
             console_report = executive_report
         elif args.report_type == "team":
-            console_report = team_report
+            # Streamed straight to disk, so read back only when it is shown
+            console_report = team_file.read_text(encoding='utf-8')
         elif args.report_type == "failure":
-            console_report = failure_report
+            console_report = failure_file.read_text(encoding='utf-8')
         elif args.report_type == "slack":
             console_report = slack_report
         else:
@@ -72,21 +72,27 @@ def main():
         # Process artifacts
         print(f"📦 Processing {len(artifacts)} artifacts...")
         all_test_results = {}
+        pytest_artifacts = {}
         
         for artifact in artifacts:
-            artifact_name = artifact['name']
+            artifact_name = artifact.name
             
             # Only process artifacts that start with "PyTest test_report="
             if not artifact_name.startswith("PyTest test_report="):
                 print(f"⏭️  Skipping artifact (not PyTest test_report): {artifact_name}")
                 continue
             
+            pytest_artifacts[artifact.id] = artifact
+        
+        # Download concurrently; each artifact is processed as soon as it is its turn
+        for artifact_id, artifact_data in github_client.download_artifacts_bulk(list(pytest_artifacts)):
+            artifact_name = pytest_artifacts[artifact_id].name
             print(f"🔍 Processing PyTest artifact: {artifact_name}")
                 
-            artifact_data = github_client.download_artifact(artifact['id'])
-            extracted_files = artifact_processor.extract_artifact(
-                artifact_data, artifact_name, output_dir
-            )
+            with artifact_data:
+                extracted_files = artifact_processor.extract_artifact(
+                    artifact_data, artifact_name, output_dir
+                )
             
             test_results = artifact_processor.process_test_files(extracted_files)
             if test_results:
@@ -104,16 +110,6 @@ def main():
             run_info, all_test_results, args.run_id
         )
         
-        # Team Summary (for team leads)
-        team_report = email_generator.generate_team_summary(
-            run_info, all_test_results, args.run_id
-        )
-        
-        # Failure Analysis (for bug creation)
-        failure_report = email_generator.generate_failure_focused_report(
-            run_info, all_test_results, args.run_id
-        )
-        
         # Slack Summary (for chat notifications)
         slack_report = email_generator.generate_slack_summary(
             run_info, all_test_results, args.run_id
@@ -124,16 +120,26 @@ def main():
         
         reports = {
             'executive_summary': (exec_report, f"📊 Executive Summary - {date_str}"),
-            'team_summary': (team_report, f"👥 Team Summary - {date_str}"),
-            'failure_analysis': (failure_report, f"🐛 Failure Analysis - {date_str}"),
+            'team_summary': (None, f"👥 Team Summary - {date_str}"),
+            'failure_analysis': (None, f"🐛 Failure Analysis - {date_str}"),
             'slack_summary': (slack_report, f"💬 Slack Summary - {date_str}")
         }
         
+        # Team Summary (for team leads) and Failure Analysis (for bug creation)
+        # are written straight to their files instead of being built in memory
+        streamed_reports = {
+            'team_summary': email_generator.generate_team_summary,
+            'failure_analysis': email_generator.generate_failure_focused_report,
+        }
+        
         saved_files = []
         for report_type, (content, title) in reports.items():
             filename = output_dir / f"{report_type}_{date_str}_run_{args.run_id}.txt"
             with open(filename, 'w', encoding='utf-8') as f:
-                f.write(content)
+                if content is None:
+                    streamed_reports[report_type](run_info, all_test_results, args.run_id, out=f)
+                else:
+                    f.write(content)
             saved_files.append((filename, title))
         
         # Display results
@@ -165,7 +171,10 @@ def main():
             if choice in reports:
                 try:
                     import pyperclip
-                    pyperclip.copy(reports[choice][0])
+                    content = reports[choice][0]
+                    if content is None:
+                        content = output_dir.joinpath(f"{choice}_{date_str}_run_{args.run_id}.txt").read_text(encoding='utf-8')
+                    pyperclip.copy(content)
                     print(f"✅ {reports[choice][1]} copied to clipboard!")
                 except ImportError:
                     print("💡 Install pyperclip for clipboard functionality: pip install pyperclip")
@@ -232,25 +232,31 @@ class MultiWorkflowProcessor:
             
             # Process artifacts
             workflow_results = {}
+            pytest_artifacts = {}
             for artifact in artifacts:
                 # Only process artifacts that start with "PyTest test_report="
-                if not artifact['name'].startswith("PyTest test_report="):
-                    print(f"     ⏭️  Skipping {artifact['name']} (not PyTest test_report)")
+                if not artifact.name.startswith("PyTest test_report="):
+                    print(f"     ⏭️  Skipping {artifact.name} (not PyTest test_report)")
                     continue
-                    
-                print(f"     🔍 Processing PyTest artifact: {artifact['name']}")
-                artifact_data = self.github_client.download_artifact(artifact['id'])
-                extracted_files = self.artifact_processor.extract_artifact(
-                    artifact_data, artifact['name'], output_dir / workflow_name
-                )
                 
-                print(f"     📁 Extracted {len(extracted_files)} files from {artifact['name']}")
+                pytest_artifacts[artifact.id] = artifact
+            
+            # Download concurrently; each artifact is processed as soon as it is its turn
+            for artifact_id, artifact_data in self.github_client.download_artifacts_bulk(list(pytest_artifacts)):
+                artifact = pytest_artifacts[artifact_id]
+                print(f"     🔍 Processing PyTest artifact: {artifact.name}")
+                with artifact_data:
+                    extracted_files = self.artifact_processor.extract_artifact(
+                        artifact_data, artifact.name, output_dir / workflow_name
+                    )
+                
+                print(f"     📁 Extracted {len(extracted_files)} files from {artifact.name}")
                 if extracted_files:
                     print(f"     📄 Sample files: {[f.name for f in extracted_files[:3]]}")
                 
                 test_results = self.artifact_processor.process_test_files(extracted_files)
                 if test_results:
-                    workflow_results[artifact['name']] = test_results
+                    workflow_results[artifact.name] = test_results
                     print(f"     ✅ Found {len(test_results)} test suites with results")
                     for suite_name, suite_result in test_results.items():
                         print(f"        📊 {suite_name}: {suite_result.passed}P/{suite_result.failed}F/{suite_result.skipped}S")
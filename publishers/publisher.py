@@ -97,22 +97,28 @@ def main():
         
         print(f"📦 Processing {len(artifacts)} artifacts...")
         all_test_results = {}
+        pytest_artifacts = {}
         
         for artifact in artifacts:
             # Only process artifacts that start with "PyTest test_report="
-            if not artifact['name'].startswith("PyTest test_report="):
-                print(f"⏭️  Skipping artifact (not PyTest test_report): {artifact['name']}")
+            if not artifact.name.startswith("PyTest test_report="):
+                print(f"⏭️  Skipping artifact (not PyTest test_report): {artifact.name}")
                 continue
-                
-            print(f"🔍 Processing PyTest artifact: {artifact['name']}")
-            artifact_data = github_client.download_artifact(artifact['id'])
-            extracted_files = artifact_processor.extract_artifact(
-                artifact_data, artifact['name'], output_dir
-            )
+            
+            pytest_artifacts[artifact.id] = artifact
+        
+        # Download concurrently; each artifact is processed as soon as it is its turn
+        for artifact_id, artifact_data in github_client.download_artifacts_bulk(list(pytest_artifacts)):
+            artifact = pytest_artifacts[artifact_id]
+            print(f"🔍 Processing PyTest artifact: {artifact.name}")
+            with artifact_data:
+                extracted_files = artifact_processor.extract_artifact(
+                    artifact_data, artifact.name, output_dir
+                )
             
             test_results = artifact_processor.process_test_files(extracted_files)
             if test_results:
-                all_test_results[artifact['name']] = test_results
+                all_test_results[artifact.name] = test_results
         
         if not all_test_results:
             print("⚠️  No test results found")